@@ -1,7 +1,8 @@
 import os
 import random
-from datetime import datetime, timedelta
-from typing import List, Optional
+import sys
+from datetime import timedelta
+from typing import Dict, List, Optional
 
 from BankClock import BankClock
 from Card import Card, CreditCard, DebitCard
@@ -17,8 +18,62 @@ class Account:
     BRANCH_IFSC = "SCBA0005621"
     BRANCH_NAME = "Jakkasandra"
     ACCOUNT_NUMBER_PREFIX = "5621"
+
+    # Branch text built once from the constants above
+    _BRANCH_DETAILS_STR = f"""Branch Details:
+IFSC Code: {BRANCH_IFSC}
+Branch Name: {BRANCH_NAME}
+Branch Code: {ACCOUNT_NUMBER_PREFIX}"""
+    _CERT_BRANCH_SECTION = f"""Branch Name:            {BRANCH_NAME}
+IFSC Code:              {BRANCH_IFSC}
+Branch Code:            {ACCOUNT_NUMBER_PREFIX}
+"""
     _used_account_numbers = set()
     _used_numbers_file = "data/account_numbers.txt"
+    _used_numbers_loaded = False
+
+    # Private constants (shared by all accounts)
+    _MIN_OPERATIONAL_BALANCE = 300.0
+    _MAX_DEPOSIT_PER_TXN = 100000.0
+    _MINOR_DAILY_WITHDRAWAL_LIMIT = 2500.0
+    _MINOR_DAILY_TRANSACTION_LIMIT = 10000.0
+    _AMB_REQUIREMENTS = {
+        "Pride": 2000.0,
+        "Bespoke": 200000.0,
+        "Club": 10000.0,
+        "Delite": 5000.0,
+        "Future": 0.0,
+    }
+    _AMB_FEE_AMOUNT = 300.0
+    _MINOR_META = ";minorAccount=true"
+
+    # (requested mode, amount >= RTGS threshold) -> routed mode
+    _RTGS_THRESHOLD = 200000.0
+    _TRANSFER_ROUTES = {
+        ("NEFT", True): "RTGS",
+        ("RTGS", False): "NEFT",
+    }
+
+    __slots__ = (
+        "customer_id",
+        "username",
+        "password",
+        "first_name",
+        "last_name",
+        "dob",
+        "gender",
+        "account_type",
+        "account_number",
+        "balance",
+        "transactions",
+        "failed_attempts",
+        "locked",
+        "pending_amb_fees",
+        "_cards_by_id",
+        "_credit_cards",
+        "_bills_by_id",
+        "salary_profile",
+    )
 
     def __init__(
         self,
@@ -51,25 +106,33 @@ class Account:
         self.failed_attempts = failed_attempts
         self.locked = locked
         self.pending_amb_fees = pending_amb_fees
-        self.cards: List[Card] = []
+        self._cards_by_id: Dict[str, Card] = {}
+        self._credit_cards: List[CreditCard] = []  # Subset billed daily
 
         # Simulation features
-        self.recurring_bills: List[RecurringBill] = []
+        self._bills_by_id: Dict[str, RecurringBill] = {}
         self.salary_profile: Optional[SalaryProfile] = None
 
-        # Private constants
-        self._min_operational_balance = 300.0
-        self._max_deposit_per_txn = 100000.0
-        self._minor_daily_withdrawal_limit = 2500.0
-        self._minor_daily_transaction_limit = 10000.0
-        self._amb_requirements = {
-            "Pride": 2000.0,
-            "Bespoke": 200000.0,
-            "Club": 10000.0,
-            "Delite": 5000.0,
-            "Future": 0.0,
-        }
-        self._amb_fee_amount = 300.0
+    @property
+    def cards(self) -> List[Card]:
+        """Linked cards in the order they were added"""
+        return list(self._cards_by_id.values())
+
+    @cards.setter
+    def cards(self, cards: List[Card]):
+        self._cards_by_id = {card.card_id: card for card in cards}
+        self._credit_cards = [
+            card for card in self._cards_by_id.values() if isinstance(card, CreditCard)
+        ]
+
+    @property
+    def recurring_bills(self) -> List[RecurringBill]:
+        """Recurring bills in the order they were added"""
+        return list(self._bills_by_id.values())
+
+    @recurring_bills.setter
+    def recurring_bills(self, bills: List[RecurringBill]):
+        self._bills_by_id = {bill.id: bill for bill in bills}
 
     @property
     def is_minor_account(self) -> bool:
@@ -78,7 +141,7 @@ class Account:
 
     def get_amb_requirement(self) -> float:
         """Get Average Monthly Balance requirement for this account type"""
-        return self._amb_requirements.get(self.account_type, 0.0)
+        return self._AMB_REQUIREMENTS.get(self.account_type, 0.0)
 
     def get_today_withdrawals(self) -> float:
         """Get total withdrawals made today"""
@@ -87,14 +150,8 @@ class Account:
 
         for txn in self.transactions:
             if txn.type == "WITHDRAW":
-                try:
-                    txn_date = datetime.strptime(
-                        txn.timestamp, "%d-%m-%Y %H:%M:%S"
-                    ).date()
-                    if txn_date == today:
-                        total += txn.amount
-                except:
-                    pass
+                if txn.get_date() == today:
+                    total += txn.amount
 
         return total
 
@@ -105,14 +162,8 @@ class Account:
 
         for txn in self.transactions:
             if txn.type == "WITHDRAW" or txn.type.endswith("_SENT"):
-                try:
-                    txn_date = datetime.strptime(
-                        txn.timestamp, "%d-%m-%Y %H:%M:%S"
-                    ).date()
-                    if txn_date == today:
-                        total += txn.amount
-                except:
-                    pass
+                if txn.get_date() == today:
+                    total += txn.amount
 
         return total
 
@@ -123,11 +174,11 @@ class Account:
 
         amb_req = self.get_amb_requirement()
 
-        if self.balance < amb_req and self.balance >= self._amb_fee_amount:
-            self.balance -= self._amb_fee_amount
+        if self.balance < amb_req and self.balance >= self._AMB_FEE_AMOUNT:
+            self.balance -= self._AMB_FEE_AMOUNT
             fee_txn = Transaction(
                 type="AMB_FEE",
-                amount=self._amb_fee_amount,
+                amount=self._AMB_FEE_AMOUNT,
                 resulting_balance=self.balance,
             )
             self.transactions.append(fee_txn)
@@ -137,18 +188,18 @@ class Account:
                 username=self.username,
                 account_number=self.account_number,
                 action="AMB_FEE",
-                amount=self._amb_fee_amount,
+                amount=self._AMB_FEE_AMOUNT,
                 resulting_balance=self.balance,
                 txn_id=fee_txn.id,
             )
             print(
-                f"AMB fee of Rs. {self._amb_fee_amount} INR charged (balance below Rs. {amb_req} INR)."
+                f"AMB fee of Rs. {self._AMB_FEE_AMOUNT} INR charged (balance below Rs. {amb_req} INR)."
             )
 
-        elif self.balance < amb_req and self.balance < self._amb_fee_amount:
-            self.pending_amb_fees += self._amb_fee_amount
+        elif self.balance < amb_req and self.balance < self._AMB_FEE_AMOUNT:
+            self.pending_amb_fees += self._AMB_FEE_AMOUNT
             print(
-                f"AMB fee of Rs. {self._amb_fee_amount} INR accrued. Will be collected on next deposit."
+                f"AMB fee of Rs. {self._AMB_FEE_AMOUNT} INR accrued. Will be collected on next deposit."
             )
 
     def _settle_pending_fees(self):
@@ -191,7 +242,7 @@ class Account:
             print("Only debit cards can be used for deposits.")
             return
 
-        if card not in self.cards:
+        if self._cards_by_id.get(card.card_id) is not card:
             print("Card not linked to this account.")
             return
 
@@ -203,13 +254,13 @@ class Account:
 
         if self.is_minor_account:
             today_transactions = self.get_today_transactions()
-            if today_transactions + amount > self._minor_daily_transaction_limit:
-                remaining = self._minor_daily_transaction_limit - today_transactions
+            if today_transactions + amount > self._MINOR_DAILY_TRANSACTION_LIMIT:
+                remaining = self._MINOR_DAILY_TRANSACTION_LIMIT - today_transactions
                 print(
                     "Deposit amount exceeds daily transaction limit for minor accounts."
                 )
                 print(
-                    f"Daily transaction limit: Rs. {self._minor_daily_transaction_limit:.2f} INR"
+                    f"Daily transaction limit: Rs. {self._MINOR_DAILY_TRANSACTION_LIMIT:.2f} INR"
                 )
                 print(f"Already transacted today: Rs. {today_transactions:.2f} INR")
                 print(f"Remaining limit: Rs. {remaining:.2f} INR")
@@ -235,9 +286,8 @@ class Account:
         )
         self.transactions.append(txn)
 
-        metadata = f"cardId={card.card_id};cardNumber={card.card_number[-4:]};network={card.network}"
-        if self.is_minor_account:
-            metadata += ";minorAccount=true"
+        metadata = f"cardId={card.card_id};cardNumber={card.last4};network={card.network}"
+        metadata += self._MINOR_META if self.is_minor_account else ""
 
         DataStore.append_activity(
             timestamp=txn.timestamp,
@@ -250,12 +300,12 @@ class Account:
             metadata=metadata,
         )
         print(f"Deposit successful! Transaction ID: {txn.id}")
-        print(f"Card used: {card.network} **** **** **** {card.card_number[-4:]}")
+        print(f"Card used: {card.network} **** **** **** {card.last4}")
 
         if self.is_minor_account:
             new_transactions = self.get_today_transactions()
             print(
-                f"Remaining daily transaction limit: Rs. {self._minor_daily_transaction_limit - new_transactions:.2f} INR"
+                f"Remaining daily transaction limit: Rs. {self._MINOR_DAILY_TRANSACTION_LIMIT - new_transactions:.2f} INR"
             )
 
         self._check_and_apply_amb_fee()
@@ -277,7 +327,7 @@ class Account:
             print("Only debit cards can be used for withdrawals.")
             return
 
-        if card not in self.cards:
+        if self._cards_by_id.get(card.card_id) is not card:
             print("Card not linked to this account.")
             return
 
@@ -290,39 +340,39 @@ class Account:
         if self.is_minor_account:
             today_withdrawals = self.get_today_withdrawals()
 
-            if today_withdrawals >= self._minor_daily_withdrawal_limit:
+            if today_withdrawals >= self._MINOR_DAILY_WITHDRAWAL_LIMIT:
                 print(
-                    f"Minor account daily withdrawal limit reached (Rs. {self._minor_daily_withdrawal_limit:.2f} INR per day)."
+                    f"Minor account daily withdrawal limit reached (Rs. {self._MINOR_DAILY_WITHDRAWAL_LIMIT:.2f} INR per day)."
                 )
                 print(f"Today's withdrawals: Rs. {today_withdrawals:.2f} INR")
                 return
 
-            if today_withdrawals + amount > self._minor_daily_withdrawal_limit:
-                remaining = self._minor_daily_withdrawal_limit - today_withdrawals
+            if today_withdrawals + amount > self._MINOR_DAILY_WITHDRAWAL_LIMIT:
+                remaining = self._MINOR_DAILY_WITHDRAWAL_LIMIT - today_withdrawals
                 print("Withdrawal amount exceeds daily limit for minor accounts.")
                 print(
-                    f"Daily withdrawal limit: Rs. {self._minor_daily_withdrawal_limit:.2f} INR"
+                    f"Daily withdrawal limit: Rs. {self._MINOR_DAILY_WITHDRAWAL_LIMIT:.2f} INR"
                 )
                 print(f"Already withdrawn today: Rs. {today_withdrawals:.2f} INR")
                 print(f"Remaining limit: Rs. {remaining:.2f} INR")
                 return
 
             today_transactions = self.get_today_transactions()
-            if today_transactions + amount > self._minor_daily_transaction_limit:
-                remaining = self._minor_daily_transaction_limit - today_transactions
+            if today_transactions + amount > self._MINOR_DAILY_TRANSACTION_LIMIT:
+                remaining = self._MINOR_DAILY_TRANSACTION_LIMIT - today_transactions
                 print(
                     "Withdrawal amount exceeds daily transaction limit for minor accounts."
                 )
                 print(
-                    f"Daily transaction limit: Rs. {self._minor_daily_transaction_limit:.2f} INR"
+                    f"Daily transaction limit: Rs. {self._MINOR_DAILY_TRANSACTION_LIMIT:.2f} INR"
                 )
                 print(f"Already transacted today: Rs. {today_transactions:.2f} INR")
                 print(f"Remaining limit: Rs. {remaining:.2f} INR")
                 return
 
-        if self.balance - amount < self._min_operational_balance:
+        if self.balance - amount < self._MIN_OPERATIONAL_BALANCE:
             print(
-                f"Insufficient funds. You must keep at least Rs. {self._min_operational_balance:.2f} INR."
+                f"Insufficient funds. You must keep at least Rs. {self._MIN_OPERATIONAL_BALANCE:.2f} INR."
             )
             return
 
@@ -346,9 +396,8 @@ class Account:
         )
         self.transactions.append(txn)
 
-        metadata = f"cardId={card.card_id};cardNumber={card.card_number[-4:]};network={card.network}"
-        if self.is_minor_account:
-            metadata += ";minorAccount=true"
+        metadata = f"cardId={card.card_id};cardNumber={card.last4};network={card.network}"
+        metadata += self._MINOR_META if self.is_minor_account else ""
 
         DataStore.append_activity(
             timestamp=txn.timestamp,
@@ -361,16 +410,16 @@ class Account:
             metadata=metadata,
         )
         print(f"Withdraw successful! Transaction ID: {txn.id}")
-        print(f"Card used: {card.network} **** **** **** {card.card_number[-4:]}")
+        print(f"Card used: {card.network} **** **** **** {card.last4}")
 
         if self.is_minor_account:
             new_withdrawals = self.get_today_withdrawals()
             new_transactions = self.get_today_transactions()
             print(
-                f"Remaining daily withdrawal limit: Rs. {self._minor_daily_withdrawal_limit - new_withdrawals:.2f} INR"
+                f"Remaining daily withdrawal limit: Rs. {self._MINOR_DAILY_WITHDRAWAL_LIMIT - new_withdrawals:.2f} INR"
             )
             print(
-                f"Remaining daily transaction limit: Rs. {self._minor_daily_transaction_limit - new_transactions:.2f} INR"
+                f"Remaining daily transaction limit: Rs. {self._MINOR_DAILY_TRANSACTION_LIMIT - new_transactions:.2f} INR"
             )
 
         self._check_and_apply_amb_fee()
@@ -387,36 +436,36 @@ class Account:
 
         if self.is_minor_account:
             today_transactions = self.get_today_transactions()
-            if today_transactions + amount > self._minor_daily_transaction_limit:
-                remaining = self._minor_daily_transaction_limit - today_transactions
+            if today_transactions + amount > self._MINOR_DAILY_TRANSACTION_LIMIT:
+                remaining = self._MINOR_DAILY_TRANSACTION_LIMIT - today_transactions
                 print(
                     "Transfer amount exceeds daily transaction limit for minor accounts."
                 )
                 print(
-                    f"Daily transaction limit: Rs. {self._minor_daily_transaction_limit:.2f} INR"
+                    f"Daily transaction limit: Rs. {self._MINOR_DAILY_TRANSACTION_LIMIT:.2f} INR"
                 )
                 print(f"Already transacted today: Rs. {today_transactions:.2f} INR")
                 print(f"Remaining limit: Rs. {remaining:.2f} INR")
                 return
 
         # Determine actual transfer mode
-        actual_mode = requested_mode
-        if requested_mode != "INTER_ACCOUNT":
-            if amount >= 200000.0 and requested_mode == "NEFT":
-                actual_mode = "RTGS"
+        actual_mode = self._TRANSFER_ROUTES.get(
+            (requested_mode, amount >= self._RTGS_THRESHOLD), requested_mode
+        )
+        if actual_mode != requested_mode:
+            if actual_mode == "RTGS":
                 print(
                     f"Amount Rs. {amount:.2f} INR is >= Rs. 2,00,000.00. Automatically routing to RTGS."
                 )
-            elif amount < 200000.0 and requested_mode == "RTGS":
-                actual_mode = "NEFT"
+            else:
                 print(
                     f"Amount Rs. {amount:.2f} INR is below RTGS threshold (Rs. 2,00,000.00). Routing to NEFT instead."
                 )
 
         enforce_min = actual_mode != "INTER_ACCOUNT"
-        if enforce_min and (self.balance - amount < self._min_operational_balance):
+        if enforce_min and (self.balance - amount < self._MIN_OPERATIONAL_BALANCE):
             print(
-                f"Insufficient funds. Must keep at least Rs. {self._min_operational_balance:.2f} INR."
+                f"Insufficient funds. Must keep at least Rs. {self._MIN_OPERATIONAL_BALANCE:.2f} INR."
             )
             return
 
@@ -446,30 +495,23 @@ class Account:
         recipient.transactions.append(txn_recv)
 
         metadata = f"requestedMode={requested_mode};routedMode={actual_mode}"
-        if self.is_minor_account:
-            metadata += ";minorAccount=true"
+        metadata += self._MINOR_META if self.is_minor_account else ""
 
-        DataStore.append_activity(
+        DataStore.append_transfer(
             timestamp=txn_send.timestamp,
-            username=self.username,
-            account_number=self.account_number,
-            action=f"{actual_mode}_SENT",
+            mode=actual_mode,
             amount=amount,
-            resulting_balance=self.balance,
-            txn_id=txn_send.id,
+            sender_username=self.username,
+            sender_account_number=self.account_number,
+            sender_balance=self.balance,
+            sender_txn_id=txn_send.id,
+            recipient_username=recipient.username,
+            recipient_account_number=recipient.account_number,
+            recipient_balance=recipient.balance,
+            recipient_txn_id=txn_recv.id,
             cheque_id=cheque_id,
             metadata=metadata,
         )
-        DataStore.append_activity(
-            timestamp=txn_recv.timestamp,
-            username=recipient.username,
-            account_number=recipient.account_number,
-            action=f"{actual_mode}_RECEIVED",
-            amount=amount,
-            resulting_balance=recipient.balance,
-            txn_id=txn_recv.id,
-            cheque_id=cheque_id,
-        )
 
         print(
             f"{actual_mode} transfer successful. Sent: Rs. {amount:.2f} INR | Transaction ID: {txn_send.id}"
@@ -480,7 +522,7 @@ class Account:
         if self.is_minor_account:
             new_transactions = self.get_today_transactions()
             print(
-                f"Remaining daily transaction limit: Rs. {self._minor_daily_transaction_limit - new_transactions:.2f} INR"
+                f"Remaining daily transaction limit: Rs. {self._MINOR_DAILY_TRANSACTION_LIMIT - new_transactions:.2f} INR"
             )
 
         if enforce_min:
@@ -589,14 +631,14 @@ class Account:
         if limit:
             transactions = transactions[-limit:]
 
-        # Display header
-        print("\n" + "=" * 130)
-        print(f"TRANSACTION HISTORY - {len(transactions)} transaction(s)")
-        print("=" * 130)
-        print(
-            f"{'Txn ID':<20} {'Date/Time':<20} {'Type':<25} {'Card':<12} {'Amount':<18} {'Balance':<15}"
-        )
-        print("-" * 130)
+        # Build header and rows, then write the whole table at once
+        lines = [
+            "\n" + "=" * 130,
+            f"TRANSACTION HISTORY - {len(transactions)} transaction(s)",
+            "=" * 130,
+            f"{'Txn ID':<20} {'Date/Time':<20} {'Type':<25} {'Card':<12} {'Amount':<18} {'Balance':<15}",
+            "-" * 130,
+        ]
 
         for txn in transactions:
             # Extract card info if available
@@ -644,12 +686,13 @@ class Account:
             # Format balance
             balance_str = f"Rs. {txn.resulting_balance:>12,.2f}"
 
-            print(
+            lines.append(
                 f"{txn.id:<20} {txn.timestamp:<20} {txn.type:<25} "
                 f"{card_info:<12} {amount_str:<18} {balance_str:<15} INR"
             )
 
-        print("=" * 130)
+        lines.append("=" * 130)
+        sys.stdout.write("\n".join(lines) + "\n")
 
         # Show summary statistics
         total_credit = sum(t.amount for t in transactions if t.amount > 0)
@@ -666,12 +709,12 @@ class Account:
             print("\n" + "-" * 130)
             print("⚠️  Minor Account Daily Limits Summary:")
             print(
-                f"   Withdrawal Limit: Rs. {self._minor_daily_withdrawal_limit:.2f} INR "
-                f"(Used: Rs. {today_withdrawals:.2f}, Remaining: Rs. {self._minor_daily_withdrawal_limit - today_withdrawals:.2f} INR)"
+                f"   Withdrawal Limit: Rs. {self._MINOR_DAILY_WITHDRAWAL_LIMIT:.2f} INR "
+                f"(Used: Rs. {today_withdrawals:.2f}, Remaining: Rs. {self._MINOR_DAILY_WITHDRAWAL_LIMIT - today_withdrawals:.2f} INR)"
             )
             print(
-                f"   Transaction Limit: Rs. {self._minor_daily_transaction_limit:.2f} INR "
-                f"(Used: Rs. {today_transactions:.2f}, Remaining: Rs. {self._minor_daily_transaction_limit - today_transactions:.2f} INR)"
+                f"   Transaction Limit: Rs. {self._MINOR_DAILY_TRANSACTION_LIMIT:.2f} INR "
+                f"(Used: Rs. {today_transactions:.2f}, Remaining: Rs. {self._MINOR_DAILY_TRANSACTION_LIMIT - today_transactions:.2f} INR)"
             )
             print("-" * 130)
 
@@ -679,38 +722,39 @@ class Account:
 
     def add_recurring_bill(self, bill: RecurringBill):
         """Add a recurring bill to the account"""
-        self.recurring_bills.append(bill)
+        self._bills_by_id[bill.id] = bill
         print(
             f"Recurring bill added: {bill.name} - Rs. {bill.base_amount:.2f} INR ({bill.frequency})"
         )
 
     def remove_recurring_bill(self, bill_id: str):
         """Remove a recurring bill by ID"""
-        self.recurring_bills = [b for b in self.recurring_bills if b.id != bill_id]
+        self._bills_by_id.pop(bill_id, None)
         print("Recurring bill removed.")
 
     def show_recurring_bills(self):
         """Display all recurring bills"""
-        if not self.recurring_bills:
+        if not self._bills_by_id:
             print("No recurring bills set up.")
         else:
-            print("\nRecurring Bills")
-            print("=" * 70)
-            print(
-                f"{'ID':<10} {'Name':<20} {'Amount':<15} {'Frequency':<12} {'Due Day':<8}"
+            lines = [
+                "\nRecurring Bills",
+                "=" * 70,
+                f"{'ID':<10} {'Name':<20} {'Amount':<15} {'Frequency':<12} {'Due Day':<8}",
+                "=" * 70,
+            ]
+            lines.extend(
+                f"{bill.id:<10} {bill.name:<20} Rs. {bill.base_amount:<14.2f} {bill.frequency:<12} {bill.day_of_month:<8}"
+                for bill in self._bills_by_id.values()
             )
-            print("=" * 70)
-            for bill in self.recurring_bills:
-                print(
-                    f"{bill.id:<10} {bill.name:<20} Rs. {bill.base_amount:<14.2f} {bill.frequency:<12} {bill.day_of_month:<8}"
-                )
-            print("=" * 70)
+            lines.append("=" * 70)
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def update_dynamic_bills(self):
         """Update recurring bills that are linked to credit cards"""
         updated = []
 
-        for bill in self.recurring_bills:
+        for bill in self._bills_by_id.values():
             if bill.is_dynamic and bill.linked_card_id:
                 card = self.get_card_by_id(bill.linked_card_id)
 
@@ -730,13 +774,29 @@ class Account:
 
         return updated
 
+    def has_daily_tasks(self, today) -> bool:
+        """
+        Cheap pre-check used by Bank.process_daily_tasks
+
+        True when the account has a salary profile, or an auto-debit bill or
+        credit card statement falls on today's day of the month.
+        """
+        if self.salary_profile is not None:
+            return True
+        day = today.day
+        return any(
+            bill.auto_debit and bill.day_of_month == day
+            for bill in self._bills_by_id.values()
+        ) or any(card.billing_day == day for card in self._credit_cards)
+
     def process_recurring_bills(self, today, bank) -> int:
         """Process recurring bills for today with credit card payment support"""
         from RecurringBill import PaymentMethod
 
         processed = 0
+        out = []
 
-        for bill in self.recurring_bills:
+        for bill in self._bills_by_id.values():
             # Only attempt to process bills that are set to auto-debit and due today
             if not (bill.auto_debit and bill.should_process_today(today)):
                 continue
@@ -755,27 +815,32 @@ class Account:
                     if card and isinstance(card, CreditCard):
                         success, msg, txn_id = card.pay_bill(amount, self)
                         if success:
-                            print(f"✅ Auto-paid {bill.name}: Rs. {amount:,.2f}")
-                            print(f"   💳 {card.network} credit card paid")
+                            out.append(f"✅ Auto-paid {bill.name}: Rs. {amount:,.2f}")
+                            out.append(f"   💳 {card.network} credit card paid")
                             DataStore.append_activity(
-                                timestamp=BankClock.get_formatted_datetime(),
+                                timestamp=BankClock.get_iso_datetime(),
                                 username=self.username,
                                 account_number=self.account_number,
                                 action="RECURRING_BILL_CREDIT_CARD_PAYMENT",
                                 amount=amount,
                                 resulting_balance=self.balance,
                                 txn_id=txn_id,
-                                metadata=f"billId={bill.id};category={bill.category};nachId={bill.nach_id};cardId={card.card_id}",
+                                metadata={
+                                    "billId": bill.id,
+                                    "category": bill.category,
+                                    "nachId": bill.nach_id,
+                                    "cardId": card.card_id,
+                                },
                             )
                             processed += 1
                             bill.last_processed = today
                         else:
-                            print(f"⚠️  Failed to auto-pay {bill.name}: {msg}")
+                            out.append(f"⚠️  Failed to auto-pay {bill.name}: {msg}")
                     else:
-                        print(f"⚠️  Payment card not found for {bill.name}")
+                        out.append(f"⚠️  Payment card not found for {bill.name}")
                 else:
                     # Pay directly from bank account
-                    if self.balance - amount >= self._min_operational_balance:
+                    if self.balance - amount >= self._MIN_OPERATIONAL_BALANCE:
                         self.balance -= amount
 
                         txn = Transaction(
@@ -796,14 +861,18 @@ class Account:
                             amount=amount,
                             resulting_balance=self.balance,
                             txn_id=txn.id,
-                            metadata=f"billId={bill.id};category={bill.category};nachId={bill.nach_id}",
+                            metadata={
+                                "billId": bill.id,
+                                "category": bill.category,
+                                "nachId": bill.nach_id,
+                            },
                         )
 
-                        print(f"✅ Auto-paid {bill.name}: Rs. {amount:,.2f}")
+                        out.append(f"✅ Auto-paid {bill.name}: Rs. {amount:,.2f}")
                         processed += 1
                         bill.last_processed = today
                     else:
-                        print(f"⚠️  Insufficient balance to pay {bill.name}")
+                        out.append(f"⚠️  Insufficient balance to pay {bill.name}")
 
             # CASE 2: Pay via Credit Card
             elif bill.payment_method == PaymentMethod.CREDIT_CARD:
@@ -857,22 +926,30 @@ class Account:
                             amount=amount,
                             resulting_balance=self.balance,
                             txn_id=txn.id,
-                            metadata=f"billId={bill.id};cardId={card.card_id};rewardPoints={reward_points};nachId={bill.nach_id}",
+                            metadata={
+                                "billId": bill.id,
+                                "cardId": card.card_id,
+                                "rewardPoints": reward_points,
+                                "nachId": bill.nach_id,
+                            },
                         )
 
-                        print(
+                        out.append(
                             f"✅ Auto-paid {bill.name}: Rs. {amount:,.2f} via {card.network}"
                         )
-                        print(f"   💎 Earned {reward_points} reward points!")
+                        out.append(f"   💎 Earned {reward_points} reward points!")
 
                         processed += 1
                         bill.last_processed = today
                     else:
-                        print(f"⚠️  Insufficient credit limit for {bill.name}")
+                        out.append(f"⚠️  Insufficient credit limit for {bill.name}")
                 else:
-                    print(f"⚠️  Payment card not found for {bill.name}")
+                    out.append(f"⚠️  Payment card not found for {bill.name}")
 
-        # Do not overwrite self.recurring_bills here — keep configured bills intact
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+
+        # Bills are updated in place; the index itself is left untouched
         return processed
 
     # ========== SALARY MANAGEMENT ==========
@@ -957,14 +1034,9 @@ class Account:
         recent_expenses = []
         for txn in self.transactions:
             if (txn.type == "EXPENSE" or txn.type == "BILL_PAYMENT") and txn.category:
-                try:
-                    txn_date = datetime.strptime(
-                        txn.timestamp, "%d-%m-%Y %H:%M:%S"
-                    ).date()
-                    if txn_date >= cutoff_date:
-                        recent_expenses.append(txn)
-                except:
-                    pass
+                txn_date = txn.get_date()
+                if txn_date is not None and txn_date >= cutoff_date:
+                    recent_expenses.append(txn)
 
         if not recent_expenses:
             print(f"No expenses found in the last {days} days.")
@@ -998,23 +1070,29 @@ class Account:
 
     def add_card(self, card: Card):
         """Add a card to this account"""
-        self.cards.append(card)
+        self._cards_by_id[card.card_id] = card
+        if isinstance(card, CreditCard):
+            self._credit_cards.append(card)
         print(f"{card.card_type} card added successfully")
-        print(f"Card Number: {card.card_number[-4:].rjust(16, '*')}")
+        print(f"Card Number: {card.last4.rjust(16, '*')}")
         print(f"Expiry: {card.expiry_date.strftime('%m/%Y')}")
         if isinstance(card, CreditCard):
             print(f"Credit Limit: Rs. {card.credit_limit:,.2f} INR")
 
     def get_card_by_id(self, card_id: str) -> Optional[Card]:
         """Get card by card ID"""
-        for card in self.cards:
-            if card.card_id == card_id:
-                return card
-        return None
+        return self._cards_by_id.get(card_id)
+
+    def remove_card(self, card_id: str) -> Optional[Card]:
+        """Unlink a card from this account by card ID"""
+        card = self._cards_by_id.pop(card_id, None)
+        if isinstance(card, CreditCard):
+            self._credit_cards.remove(card)
+        return card
 
     def get_card_by_number(self, card_number: str) -> Optional[Card]:
         """Get card by card number (last 4 digits also works)"""
-        for card in self.cards:
+        for card in self._cards_by_id.values():
             if card.card_number == card_number or card.card_number.endswith(
                 card_number
             ):
@@ -1023,19 +1101,19 @@ class Account:
 
     def list_cards(self):
         """Display all cards linked to this account"""
-        if not self.cards:
+        if not self._cards_by_id:
             print("No cards linked to this account")
             return
 
-        print("\nLinked Cards")
-        print("=" * 95)
-        print(
-            f"{'Type':<10} {'Network':<12} {'Card Number':<20} {'Expiry':<12} {'Status':<10} {'Details':<25}"
-        )
-        print("=" * 95)
+        lines = [
+            "\nLinked Cards",
+            "=" * 95,
+            f"{'Type':<10} {'Network':<12} {'Card Number':<20} {'Expiry':<12} {'Status':<10} {'Details':<25}",
+            "=" * 95,
+        ]
 
-        for card in self.cards:
-            card_num = "**** **** **** " + card.card_number[-4:]
+        for card in self._cards_by_id.values():
+            card_num = "**** **** **** " + card.last4
             expiry = card.expiry_date.strftime("%m/%Y")
             status = (
                 "Blocked"
@@ -1048,11 +1126,12 @@ class Account:
             if isinstance(card, CreditCard):
                 details = f"Limit: Rs. {card.credit_limit:,.0f} | Used: Rs. {card.credit_used:,.0f}"
 
-            print(
+            lines.append(
                 f"{card.card_type:<10} {network:<12} {card_num:<20} {expiry:<12} {status:<10} {details:<25}"
             )
 
-        print("=" * 95)
+        lines.append("=" * 95)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def block_card(self, card_id: str):
         """Block a card"""
@@ -1062,7 +1141,7 @@ class Account:
             return
 
         card.block()
-        print(f"Card ending in {card.card_number[-4:]} has been blocked")
+        print(f"Card ending in {card.last4} has been blocked")
 
     def unblock_card(self, card_id: str):
         """Unblock a card"""
@@ -1072,7 +1151,7 @@ class Account:
             return
 
         card.unblock()
-        print(f"Card ending in {card.card_number[-4:]} has been unblocked")
+        print(f"Card ending in {card.last4} has been unblocked")
 
     def make_card_purchase(
         self, card_id: str, amount: float, merchant: str, category: str = "Shopping"
@@ -1136,7 +1215,7 @@ class Account:
 
         print("\nCredit Card Statement")
         print("=" * 60)
-        print(f"Card Number: **** **** **** {card.card_number[-4:]}")
+        print(f"Card Number: **** **** **** {card.last4}")
         print(f"Credit Limit: Rs. {card.credit_limit:,.2f} INR")
         print(f"Credit Used: Rs. {card.credit_used:,.2f} INR")
         print(f"Available Credit: Rs. {card.available_credit():,.2f} INR")
@@ -1183,71 +1262,95 @@ class Account:
             # Be defensive: don't break statement printing
             pass
 
-    def process_credit_card_bills(self, today):
-        """Process credit card bill generation for all credit cards"""
-        for card in self.cards:
-            if isinstance(card, CreditCard) and card.check_bill_generation(today):
-                bill = card.generate_bill(today)
-                if bill["success"]:
-                    print(f"\n{'=' * 60}")
-                    print("CREDIT CARD BILL GENERATED")
-                    print(f"{'=' * 60}")
-                    print(f"Card: **** **** **** {card.card_number[-4:]}")
-                    print(f"Bill Date: {bill['billDate']}")
-                    print(f"Due Date: {bill['dueDate']}")
-                    print(f"Total Outstanding: Rs. {bill['totalOutstanding']:,.2f} INR")
-                    print(f"Minimum Due: Rs. {bill['minimumDue']:,.2f} INR")
-                    if bill["interestCharged"] > 0:
-                        print(
-                            f"Interest Charged: Rs. {bill['interestCharged']:,.2f} INR"
+    def process_credit_card_bills(self, today) -> int:
+        """
+        Process credit card bill generation for all credit cards
+
+        Returns:
+            Number of cards that were due for billing today
+        """
+        if not self._credit_cards:
+            return 0
+
+        billed = 0
+        out = []
+        ts = BankClock.get_iso_datetime()
+        with DataStore.batch():
+            for card in self._credit_cards:
+                if card.check_bill_generation(today):
+                    billed += 1
+                    bill = card.generate_bill(today)
+                    if bill["success"]:
+                        out.append(f"\n{'=' * 60}")
+                        out.append("CREDIT CARD BILL GENERATED")
+                        out.append(f"{'=' * 60}")
+                        out.append(f"Card: **** **** **** {card.last4}")
+                        out.append(f"Bill Date: {bill['billDate']}")
+                        out.append(f"Due Date: {bill['dueDate']}")
+                        out.append(f"Total Outstanding: Rs. {bill['totalOutstanding']:,.2f} INR")
+                        out.append(f"Minimum Due: Rs. {bill['minimumDue']:,.2f} INR")
+                        if bill["interestCharged"] > 0:
+                            out.append(
+                                f"Interest Charged: Rs. {bill['interestCharged']:,.2f} INR"
+                            )
+                        out.append(f"{'=' * 60}\n")
+
+                        # Log activity
+                        DataStore.append_activity(
+                            timestamp=ts,
+                            username=self.username,
+                            account_number=self.account_number,
+                            action="CREDIT_CARD_BILL_GENERATED",
+                            amount=bill["totalOutstanding"],
+                            resulting_balance=None,
+                            metadata={
+                                "cardId": card.card_id,
+                                "dueDate": bill["dueDate"],
+                            },
                         )
-                    print(f"{'=' * 60}\n")
-
-                    # Log activity
-                    DataStore.append_activity(
-                        timestamp=BankClock.get_formatted_datetime(),
-                        username=self.username,
-                        account_number=self.account_number,
-                        action="CREDIT_CARD_BILL_GENERATED",
-                        amount=bill["totalOutstanding"],
-                        resulting_balance=None,
-                        metadata=f"cardId={card.card_id};dueDate={bill['dueDate']}",
-                    )
-
-                    # Auto-pay on statement generation if the card is configured
-                    try:
-                        policy = getattr(card, "auto_pay_policy", "NONE")
-                        if policy and policy.upper() != "NONE":
-                            # Determine amount to attempt
-                            if policy.upper() == "FULL":
-                                pay_amount = bill["totalOutstanding"]
-                            else:
-                                # Treat any other non-NONE policy as MINIMUM
-                                pay_amount = bill["minimumDue"]
-
-                            # Attempt payment from this account (owner of the card)
-                            success, msg, txn_id = card.pay_bill(pay_amount, self)
-                            if success:
-                                print(
-                                    f"Auto-paid card ****{card.card_number[-4:]}: Rs. {pay_amount:,.2f} via account {self.account_number}"
-                                )
-                                DataStore.append_activity(
-                                    timestamp=BankClock.get_formatted_datetime(),
-                                    username=self.username,
-                                    account_number=self.account_number,
-                                    action="AUTO_PAY_CREDIT_CARD",
-                                    amount=pay_amount,
-                                    resulting_balance=self.balance,
-                                    txn_id=txn_id,
-                                    metadata=f"cardId={card.card_id};policy={policy}",
-                                )
-                            else:
-                                print(
-                                    f"Auto-pay failed for card ****{card.card_number[-4:]}: {msg}"
-                                )
-                    except Exception:
-                        # Be defensive: any error should not stop daily processing
-                        pass
+
+                        # Auto-pay on statement generation if the card is configured
+                        try:
+                            policy = getattr(card, "auto_pay_policy", "NONE")
+                            if policy and policy.upper() != "NONE":
+                                # Determine amount to attempt
+                                if policy.upper() == "FULL":
+                                    pay_amount = bill["totalOutstanding"]
+                                else:
+                                    # Treat any other non-NONE policy as MINIMUM
+                                    pay_amount = bill["minimumDue"]
+
+                                # Attempt payment from this account (owner of the card)
+                                success, msg, txn_id = card.pay_bill(pay_amount, self)
+                                if success:
+                                    out.append(
+                                        f"Auto-paid card ****{card.last4}: Rs. {pay_amount:,.2f} via account {self.account_number}"
+                                    )
+                                    DataStore.append_activity(
+                                        timestamp=ts,
+                                        username=self.username,
+                                        account_number=self.account_number,
+                                        action="AUTO_PAY_CREDIT_CARD",
+                                        amount=pay_amount,
+                                        resulting_balance=self.balance,
+                                        txn_id=txn_id,
+                                        metadata={
+                                            "cardId": card.card_id,
+                                            "policy": policy,
+                                        },
+                                    )
+                                else:
+                                    out.append(
+                                        f"Auto-pay failed for card ****{card.last4}: {msg}"
+                                    )
+                        except Exception:
+                            # Be defensive: any error should not stop daily processing
+                            pass
+
+            if out:
+                sys.stdout.write("\n".join(out) + "\n")
+
+        return billed
 
     # ========== STATIC METHODS AND UTILITIES ==========
 
@@ -1257,24 +1360,34 @@ class Account:
         Account._load_used_numbers()
 
         while True:
-            random_part = "".join([str(random.randint(0, 9)) for _ in range(8)])
-            acc_num = Account.ACCOUNT_NUMBER_PREFIX + random_part
+            acc_num = f"{Account.ACCOUNT_NUMBER_PREFIX}{random.randrange(100_000_000):08d}"
             if acc_num not in Account._used_account_numbers:
                 Account._used_account_numbers.add(acc_num)
-                Account._save_used_numbers()
+                Account._append_used_number(acc_num)
                 return acc_num
 
     @staticmethod
     def _load_used_numbers():
-        """Load used account numbers from file"""
+        """Load used account numbers from file (once, on first use)"""
+        if Account._used_numbers_loaded:
+            return
+
         if os.path.exists(Account._used_numbers_file):
             with open(Account._used_numbers_file, "r") as f:
-                Account._used_account_numbers = set(line.strip() for line in f)
+                Account._used_account_numbers.update(line.strip() for line in f)
+        Account._used_numbers_loaded = True
+
+    @staticmethod
+    def _append_used_number(num: str):
+        """Append a single newly used account number to file"""
+        DataStore._ensure_dir(Account._used_numbers_file)
+        with open(Account._used_numbers_file, "a") as f:
+            f.write(num + "\n")
 
     @staticmethod
     def _save_used_numbers():
-        """Save used account numbers to file"""
-        os.makedirs(os.path.dirname(Account._used_numbers_file), exist_ok=True)
+        """Rewrite the used account numbers file (compaction)"""
+        DataStore._ensure_dir(Account._used_numbers_file)
         with open(Account._used_numbers_file, "w") as f:
             for num in Account._used_account_numbers:
                 f.write(num + "\n")
@@ -1295,11 +1408,23 @@ class Account:
         failed_attempts: int,
         locked: bool,
         pending_amb_fees: float,
+        persist: bool = False,
     ) -> "Account":
-        """Create an Account instance from storage data"""
-        if account_number.startswith(Account.ACCOUNT_NUMBER_PREFIX):
+        """
+        Create an Account instance from storage data
+
+        The account number is always registered in memory; it is only
+        written to the used-numbers file when persist is True. Bulk
+        restores save the file once at the end instead.
+        """
+        Account._load_used_numbers()
+        if (
+            account_number.startswith(Account.ACCOUNT_NUMBER_PREFIX)
+            and account_number not in Account._used_account_numbers
+        ):
             Account._used_account_numbers.add(account_number)
-            Account._save_used_numbers()
+            if persist:
+                Account._append_used_number(account_number)
 
         return Account(
             customer_id=customer_id,
@@ -1321,10 +1446,7 @@ class Account:
     @staticmethod
     def get_branch_details() -> str:
         """Get branch details as a formatted string"""
-        return f"""Branch Details:
-IFSC Code: {Account.BRANCH_IFSC}
-Branch Name: {Account.BRANCH_NAME}
-Branch Code: {Account.ACCOUNT_NUMBER_PREFIX}"""
+        return Account._BRANCH_DETAILS_STR
 
     @staticmethod
     def create_account(
@@ -1359,7 +1481,7 @@ Branch Code: {Account.ACCOUNT_NUMBER_PREFIX}"""
             pending_amb_fees=0.0,
         )
 
-        ts = BankClock.get_formatted_datetime()
+        ts = BankClock.get_iso_datetime()
         DataStore.append_activity(
             timestamp=ts,
             username=username,
@@ -1367,7 +1489,7 @@ Branch Code: {Account.ACCOUNT_NUMBER_PREFIX}"""
             action="ACCOUNT_CREATED",
             amount=None,
             resulting_balance=None,
-            metadata=f"type={account_type};customerId={customer_id}",
+            metadata={"type": account_type, "customerId": customer_id},
         )
 
         return acc
@@ -1387,15 +1509,15 @@ Branch Code: {Account.ACCOUNT_NUMBER_PREFIX}"""
             "accountType": self.account_type,
             "accountNumber": self.account_number,
             "balance": self.balance,
-            "transactions": [t.to_dict() for t in self.transactions],
+            "transactions": [t._to_dict_cached() for t in self.transactions],
             "failedAttempts": self.failed_attempts,
             "locked": self.locked,
             "pendingAmbFees": self.pending_amb_fees,
-            "recurringBills": [b.to_dict() for b in self.recurring_bills],
+            "recurringBills": [b.to_dict() for b in self._bills_by_id.values()],
             "salaryProfile": self.salary_profile.to_dict()
             if self.salary_profile
             else None,
-            "cards": [c.to_dict() for c in self.cards],
+            "cards": [c.to_dict() for c in self._cards_by_id.values()],
         }
 
     @staticmethod
@@ -1433,7 +1555,3 @@ Branch Code: {Account.ACCOUNT_NUMBER_PREFIX}"""
         acc.cards = [Card.from_dict(c) for c in data.get("cards", [])]
 
         return acc
-
-
-# Initialize used numbers on module load
-Account._load_used_numbers()
@@ -1,5 +1,5 @@
-import os
-from typing import TYPE_CHECKING, Optional, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from BankClock import BankClock
 from Card import CreditCard, DebitCard
@@ -8,6 +8,10 @@ from DataStore import DataStore
 if TYPE_CHECKING:
     from Account import Account
 
+# Rule lines shared by all certificate templates
+_EQ70 = "=" * 70
+_DASH70 = "-" * 70
+
 
 class AccountClosureService:
     """Service for handling account and card closures"""
@@ -24,34 +28,16 @@ class AccountClosureService:
         Returns:
             (success, message, closure_certificate_path)
         """
-        # Validation checks
-        validation_result = AccountClosureService._validate_account_closure(
-            account, bank
+        # Validation checks (also collects the linked cards to terminate)
+        is_valid, message, cards_closed = (
+            AccountClosureService._validate_account_closure(account, bank)
         )
-        if not validation_result[0]:
-            return False, validation_result[1], None
+        if not is_valid:
+            return False, message, None
 
         # Get final balance
         final_balance = account.balance
 
-        # Close all linked cards
-        cards_closed = []
-        for card in account.cards:
-            if isinstance(card, CreditCard):
-                if card.credit_used > 0 or card.outstanding_balance > 0:
-                    return (
-                        False,
-                        f"Cannot close account. Credit card ending in {card.card_number[-4:]} has outstanding balance of Rs. {card.outstanding_balance:.2f} INR",
-                        None,
-                    )
-                cards_closed.append(
-                    f"Credit Card {card.network} ending in {card.card_number[-4:]}"
-                )
-            else:
-                cards_closed.append(
-                    f"Debit Card {card.network} ending in {card.card_number[-4:]}"
-                )
-
         # Generate closure certificate
         certificate_path = AccountClosureService._generate_closure_certificate(
             account, final_balance, cards_closed
@@ -59,19 +45,20 @@ class AccountClosureService:
 
         # Log closure activity
         DataStore.append_activity(
-            timestamp=BankClock.get_formatted_datetime(),
+            timestamp=BankClock.get_iso_datetime(),
             username=account.username,
             account_number=account.account_number,
             action="ACCOUNT_CLOSED",
             amount=final_balance,
             resulting_balance=0.0,
-            metadata=f"customerId={account.customer_id};cardsTerminated={len(cards_closed)}",
+            metadata={
+                "customerId": account.customer_id,
+                "cardsTerminated": len(cards_closed),
+            },
         )
 
         # Remove from bank's active accounts
-        bank.accounts = [
-            acc for acc in bank.accounts if acc.account_number != account.account_number
-        ]
+        bank.remove_account(account)
 
         return (
             True,
@@ -80,52 +67,72 @@ class AccountClosureService:
         )
 
     @staticmethod
-    def _validate_account_closure(account: "Account", bank) -> Tuple[bool, str]:
-        """Validate if account can be closed"""
+    def _validate_account_closure(
+        account: "Account", bank
+    ) -> Tuple[bool, str, List[str]]:
+        """
+        Validate if account can be closed and list the cards to terminate
+
+        Cheap attribute checks run first so that common failures return
+        before the card loop and the loan lookup.
+        """
 
         # Check for pending AMB fees
         if account.pending_amb_fees > 0:
             return (
                 False,
                 f"Cannot close account. Pending AMB fees: Rs. {account.pending_amb_fees:.2f} INR. Please clear dues first.",
+                [],
             )
 
-        # Check for active loans
-        active_loans = [
-            loan
-            for loan in bank.loans
-            if loan.customer_id == account.customer_id and loan.status != "Closed"
-        ]
-        if active_loans:
+        # Check for active recurring bills
+        if account.recurring_bills:
             return (
                 False,
-                f"Cannot close account. {len(active_loans)} active loan(s) found. Please close all loans first.",
+                f"Cannot close account. {len(account.recurring_bills)} active recurring bill(s). Please cancel them first.",
+                [],
             )
 
-        # Check for active recurring bills
-        if account.recurring_bills:
+        # Minimum balance check
+        if account.balance < account._MIN_OPERATIONAL_BALANCE:
             return (
                 False,
-                f"Cannot close account. {len(account.recurring_bills)} active recurring bill(s). Please cancel them first.",
+                f"Account balance (Rs. {account.balance:.2f} INR) is below minimum operational balance. Deposit required before closure.",
+                [],
             )
 
-        # Check credit card outstanding balances
+        # Check credit card outstanding balances and collect cards to close
+        cards_closed = []
         for card in account.cards:
             if isinstance(card, CreditCard):
                 if card.credit_used > 0 or card.outstanding_balance > 0:
                     return (
                         False,
-                        f"Cannot close account. Credit card ending in {card.card_number[-4:]} has outstanding balance.",
+                        f"Cannot close account. Credit card ending in {card.last4} has outstanding balance.",
+                        [],
                     )
+                cards_closed.append(
+                    f"Credit Card {card.network} ending in {card.last4}"
+                )
+            else:
+                cards_closed.append(
+                    f"Debit Card {card.network} ending in {card.last4}"
+                )
 
-        # Minimum balance check
-        if account.balance < account._min_operational_balance:
+        # Check for active loans (only this customer's loans are scanned)
+        active_loans = [
+            loan
+            for loan in bank.iter_loans_for_customer(account.customer_id)
+            if loan.status != "Closed"
+        ]
+        if active_loans:
             return (
                 False,
-                f"Account balance (Rs. {account.balance:.2f} INR) is below minimum operational balance. Deposit required before closure.",
+                f"Cannot close account. {len(active_loans)} active loan(s) found. Please close all loans first.",
+                [],
             )
 
-        return True, "Validation passed"
+        return True, "Validation passed", cards_closed
 
     @staticmethod
     def _generate_closure_certificate(
@@ -135,16 +142,17 @@ class AccountClosureService:
         timestamp = BankClock.get_formatted_datetime()
         closure_date = BankClock.today().strftime("%d-%m-%Y")
 
-        certificate_content = f"""
-{"=" * 70}
+        parts = [
+            f"""
+{_EQ70}
                     ACCOUNT CLOSURE CERTIFICATE
-{"=" * 70}
+{_EQ70}
 
 Closure Date:           {closure_date}
 Closure Time:           {timestamp}
 
 ACCOUNT HOLDER DETAILS
-----------------------------------------------------------------------
+{_DASH70}
 Customer ID:            {account.customer_id}
 Name:                   {account.first_name} {account.last_name}
 Account Number:         {account.account_number}
@@ -153,29 +161,26 @@ Date of Birth:          {account.dob}
 Gender:                 {account.gender}
 
 BRANCH DETAILS
-----------------------------------------------------------------------
-Branch Name:            {account.BRANCH_NAME}
-IFSC Code:              {account.BRANCH_IFSC}
-Branch Code:            {account.ACCOUNT_NUMBER_PREFIX}
-
+{_DASH70}
+{account._CERT_BRANCH_SECTION}
 CLOSURE SUMMARY
-----------------------------------------------------------------------
+{_DASH70}
 Final Account Balance:  Rs. {final_balance:.2f} INR
 Total Transactions:     {len(account.transactions)}
 Pending AMB Fees:       Rs. {account.pending_amb_fees:.2f} INR
 Active Recurring Bills: {len(account.recurring_bills)}
 
 CARDS TERMINATED
-----------------------------------------------------------------------
+{_DASH70}
 """
+        ]
         if cards_closed:
-            for card in cards_closed:
-                certificate_content += f"  - {card}\n"
+            parts.extend(f"  - {card}\n" for card in cards_closed)
         else:
-            certificate_content += "  None\n"
+            parts.append("  None\n")
 
-        certificate_content += f"""
-{"=" * 70}
+        parts.append(f"""
+{_EQ70}
 
 This certificate confirms that the above account has been closed
 and all linked cards have been terminated. The final balance of
@@ -185,18 +190,17 @@ All recurring payments, loans, and outstanding dues have been cleared.
 
 This is a system-generated certificate and does not require a signature.
 
-{"=" * 70}
+{_EQ70}
 Generated on: {timestamp}
 System: Python Bank Management System v1.0
-{"=" * 70}
-"""
+{_EQ70}
+""")
+        certificate_content = "".join(parts)
 
         # Save certificate
-        os.makedirs("data/closure_certificates", exist_ok=True)
         file_path = f"data/closure_certificates/account_closure_{account.account_number}_{account.customer_id}.txt"
-
-        with open(file_path, "w") as f:
-            f.write(certificate_content)
+        DataStore._ensure_dir(file_path)
+        Path(file_path).write_bytes(certificate_content.encode("utf-8"))
 
         return file_path
 
@@ -222,37 +226,33 @@ System: Python Bank Management System v1.0
                 None,
             )
 
-        # Check for pending bills
-        if card.due_date and BankClock.today() <= card.due_date:
-            if card.outstanding_balance > 0:
-                return (
-                    False,
-                    f"Cannot close credit card. Bill due on {card.due_date.strftime('%d-%m-%Y')}. Clear payment first.",
-                    None,
-                )
-
         # Generate closure document
         certificate_path = AccountClosureService._generate_card_closure_certificate(
             card, account, "CREDIT"
         )
 
         # Remove card from account
-        account.cards = [c for c in account.cards if c.card_id != card.card_id]
+        account.remove_card(card.card_id)
 
         # Log activity
         DataStore.append_activity(
-            timestamp=BankClock.get_formatted_datetime(),
+            timestamp=BankClock.get_iso_datetime(),
             username=account.username,
             account_number=account.account_number,
             action="CREDIT_CARD_CLOSED",
             amount=None,
             resulting_balance=None,
-            metadata=f"cardId={card.card_id};cardNumber={card.card_number[-4:]};network={card.network};rewardPoints={card.reward_points:.0f}",
+            metadata={
+                "cardId": card.card_id,
+                "cardNumber": card.last4,
+                "network": card.network,
+                "rewardPoints": f"{card.reward_points:.0f}",
+            },
         )
 
         return (
             True,
-            f"Credit card ending in {card.card_number[-4:]} closed successfully. {card.reward_points:.0f} reward points forfeited.",
+            f"Credit card ending in {card.last4} closed successfully. {card.reward_points:.0f} reward points forfeited.",
             certificate_path,
         )
 
@@ -276,22 +276,26 @@ System: Python Bank Management System v1.0
         )
 
         # Remove card from account
-        account.cards = [c for c in account.cards if c.card_id != card.card_id]
+        account.remove_card(card.card_id)
 
         # Log activity
         DataStore.append_activity(
-            timestamp=BankClock.get_formatted_datetime(),
+            timestamp=BankClock.get_iso_datetime(),
             username=account.username,
             account_number=account.account_number,
             action="DEBIT_CARD_CLOSED",
             amount=None,
             resulting_balance=None,
-            metadata=f"cardId={card.card_id};cardNumber={card.card_number[-4:]};network={card.network}",
+            metadata={
+                "cardId": card.card_id,
+                "cardNumber": card.last4,
+                "network": card.network,
+            },
         )
 
         return (
             True,
-            f"Debit card ending in {card.card_number[-4:]} closed successfully.",
+            f"Debit card ending in {card.last4} closed successfully.",
             certificate_path,
         )
 
@@ -303,67 +307,68 @@ System: Python Bank Management System v1.0
         timestamp = BankClock.get_formatted_datetime()
         closure_date = BankClock.today().strftime("%d-%m-%Y")
 
-        certificate_content = f"""
-{"=" * 70}
+        parts = [
+            f"""
+{_EQ70}
                     {card_type} CARD CLOSURE CERTIFICATE
-{"=" * 70}
+{_EQ70}
 
 Closure Date:           {closure_date}
 Closure Time:           {timestamp}
 
 CARDHOLDER DETAILS
-----------------------------------------------------------------------
+{_DASH70}
 Customer ID:            {account.customer_id}
 Name:                   {account.first_name} {account.last_name}
 Account Number:         {account.account_number}
 
 CARD DETAILS
-----------------------------------------------------------------------
+{_DASH70}
 Card Type:              {card_type}
 Card Network:           {card.network}
-Card Number:            **** **** **** {card.card_number[-4:]}
+Card Number:            **** **** **** {card.last4}
 Card ID:                {card.card_id}
 Issue Date:             {(card.expiry_date.replace(year=card.expiry_date.year - 4)).strftime("%d-%m-%Y")}
 Expiry Date:            {card.expiry_date.strftime("%d-%m-%Y")}
 """
+        ]
 
         if card_type == "CREDIT":
-            certificate_content += f"""
+            parts.append(f"""
 CREDIT CARD SUMMARY
-----------------------------------------------------------------------
+{_DASH70}
 Credit Limit:           Rs. {card.credit_limit:,.2f} INR
 Credit Used:            Rs. {card.credit_used:.2f} INR
 Outstanding Balance:    Rs. {card.outstanding_balance:.2f} INR
 Reward Points:          {card.reward_points:.0f} (Forfeited)
-"""
+""")
 
-        certificate_content += f"""
-{"=" * 70}
+        parts.append(f"""
+{_EQ70}
 
 This certificate confirms that the above {card_type.lower()} card has been
 permanently closed and terminated. The card can no longer be used for
 any transactions.
-"""
+""")
 
         if card_type == "CREDIT":
-            certificate_content += """
+            parts.append("""
 All outstanding balances have been cleared and reward points forfeited.
-"""
+""")
 
-        certificate_content += f"""
+        parts.append(f"""
 This is a system-generated certificate and does not require a signature.
 
-{"=" * 70}
+{_EQ70}
 Generated on: {timestamp}
 System: Python Bank Management System v1.0
-{"=" * 70}
-"""
+{_EQ70}
+""")
+        certificate_content = "".join(parts)
 
         # Save certificate
-        os.makedirs("data/card_closures", exist_ok=True)
-        file_path = f"data/card_closures/{card_type.lower()}_card_closure_{card.card_number[-4:]}_{account.customer_id}.txt"
-
-        with open(file_path, "w") as f:
-            f.write(certificate_content)
+        file_path = f"data/card_closures/{card_type.lower()}_card_closure_{card.last4}_{account.customer_id}.txt"
+        DataStore._ensure_dir(file_path)
+        Path(file_path).write_bytes(certificate_content.encode("utf-8"))
 
         return file_path
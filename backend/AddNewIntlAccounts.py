@@ -1,6 +1,8 @@
 """Add new bank accounts from InternationalBankRegistry (auto-sync)"""
 
 import random
+import sys
+from itertools import starmap
 
 from DataStore import DataStore
 from InternationalBankRegistry import InternationalAccount, InternationalBankRegistry
@@ -11,13 +13,11 @@ def extract_banks_by_country(registry):
     banks_by_country = {}
 
     for account in registry.accounts.values():
-        country = account.country
-        if country not in banks_by_country:
-            banks_by_country[country] = {}
+        bucket = banks_by_country.setdefault(account.country, {})
 
         bank_key = (account.bank_name, account.swift_code)
-        if bank_key not in banks_by_country[country]:
-            banks_by_country[country][bank_key] = {
+        if bank_key not in bucket:
+            bucket[bank_key] = {
                 "name": account.bank_name,
                 "swift": account.swift_code,
                 "currency": account.currency,
@@ -48,24 +48,19 @@ print("✓ Found banks in registry code")
 new_banks_to_add = {}
 
 for country, banks in all_banks_by_country.items():
+    existing = existing_banks_by_country.get(country, {})
+    new_bucket = None
     for bank_key, bank_info in banks.items():
         # Check if this bank exists in the saved data
-        if (
-            country not in existing_banks_by_country
-            or bank_key not in existing_banks_by_country[country]
-        ):
-            if country not in new_banks_to_add:
-                new_banks_to_add[country] = {}
-            new_banks_to_add[country][bank_key] = bank_info
-
-# Show summary
-print("\n" + "=" * 80)
-print("BANK COMPARISON")
-print("=" * 80)
-
-for country in sorted(
-    set(list(existing_banks_by_country.keys()) + list(all_banks_by_country.keys()))
-):
+        if bank_key not in existing:
+            if new_bucket is None:
+                new_bucket = new_banks_to_add[country] = {}
+            new_bucket[bank_key] = bank_info
+
+# Show summary (output is collected and written in one go)
+out = ["\n" + "=" * 80, "BANK COMPARISON", "=" * 80]
+
+for country in sorted(existing_banks_by_country.keys() | all_banks_by_country.keys()):
     existing_count = len(existing_banks_by_country.get(country, {}))
     total_count = len(all_banks_by_country.get(country, {}))
     new_count = len(new_banks_to_add.get(country, {}))
@@ -76,28 +71,32 @@ for country in sorted(
     elif existing_count == total_count:
         status = "✅ Up to date"
 
-    print(f"{country:<15} {existing_count:>2}/{total_count:<2} banks  {status}")
+    out.append(f"{country:<15} {existing_count:>2}/{total_count:<2} banks  {status}")
 
-print("=" * 80)
+out.append("=" * 80)
 
-if not new_banks_to_add or all(len(banks) == 0 for banks in new_banks_to_add.values()):
-    print("\n✅ All banks from InternationalBankRegistry are already in the dataset!")
-    print(f"   Current total: {initial_count} accounts")
+if not any(new_banks_to_add.values()):
+    out.append(
+        "\n✅ All banks from InternationalBankRegistry are already in the dataset!"
+    )
+    out.append(f"   Current total: {initial_count} accounts")
+    sys.stdout.write("\n".join(out) + "\n")
     exit(0)
 
 # Show details of new banks
-print("\n🆕 NEW BANKS TO ADD:")
-print("-" * 80)
+out.append("\n🆕 NEW BANKS TO ADD:")
+out.append("-" * 80)
 total_new_banks = 0
 for country, banks in new_banks_to_add.items():
     if banks:
-        print(f"\n{country}:")
+        out.append(f"\n{country}:")
         for bank_info in banks.values():
-            print(f"   • {bank_info['name']} ({bank_info['swift']})")
+            out.append(f"   • {bank_info['name']} ({bank_info['swift']})")
             total_new_banks += 1
 
-print("-" * 80)
-print(f"Total: {total_new_banks} new banks")
+out.append("-" * 80)
+out.append(f"Total: {total_new_banks} new banks")
+sys.stdout.write("\n".join(out) + "\n")
 
 # Ask for confirmation
 ACCOUNTS_PER_BANK = 10
@@ -276,9 +275,28 @@ default_names = {
     ],
 }
 
+# Country-specific account number formats: (template, random field ranges).
+# {cc} and {prefix} are filled once; the {} fields per account.
+ACCOUNT_NUMBER_FORMATS = {
+    "UAE": ("AE{}{prefix}{}", ((10, 99), (100000000, 999999999))),
+    "USA": ("US{}{prefix}{}", ((10, 99), (1000000000, 9999999999))),
+    "UK": (
+        "GB{}{prefix}{}{}",
+        ((10, 99), (10000000, 99999999), (1000000, 9999999)),
+    ),
+    "Singapore": ("SG{}{prefix}{}", ((10, 99), (1000000000, 9999999999))),
+}
+DEFAULT_ACCOUNT_NUMBER_FORMAT = ("{cc}{}{prefix}{}", ((10, 99), (100000000, 999999999)))
+
 print("\n📝 Adding accounts...\n")
 
 accounts_added = 0
+out = []
+
+# One generator bound to locals for the whole run
+rng = random.Random()
+choices = rng.choices
+randint = rng.randint
 
 for country, banks in new_banks_to_add.items():
     if not banks:
@@ -287,53 +305,51 @@ for country, banks in new_banks_to_add.items():
     # Get appropriate names for this country
     names = names_by_region.get(country, default_names)
 
+    # Resolve the account number format once per country
+    template, ranges = ACCOUNT_NUMBER_FORMATS.get(
+        country, DEFAULT_ACCOUNT_NUMBER_FORMAT
+    )
+    template = template.replace("{cc}", country[:2].upper())
+
     for bank_info in banks.values():
-        bank_accounts = 0
-        attempts = 0
-        max_attempts = 50
-
-        while bank_accounts < ACCOUNTS_PER_BANK and attempts < max_attempts:
-            attempts += 1
-
-            # Generate unique account details
-            first_name = random.choice(names["first"])
-            last_name = random.choice(names["last"])
-            account_holder = f"{first_name} {last_name}"
-
-            # Generate country-specific account number
-            if country == "UAE":
-                account_number = f"AE{random.randint(10, 99)}{bank_info['prefix']}{random.randint(100000000, 999999999)}"
-            elif country == "USA":
-                account_number = f"US{random.randint(10, 99)}{bank_info['prefix']}{random.randint(1000000000, 9999999999)}"
-            elif country == "UK":
-                account_number = f"GB{random.randint(10, 99)}{bank_info['prefix']}{random.randint(10000000, 99999999)}{random.randint(1000000, 9999999)}"
-            elif country == "Singapore":
-                account_number = f"SG{random.randint(10, 99)}{bank_info['prefix']}{random.randint(1000000000, 9999999999)}"
-            else:
-                account_number = f"{country[:2].upper()}{random.randint(10, 99)}{bank_info['prefix']}{random.randint(100000000, 999999999)}"
-
-            # Check if account already exists
-            if account_number in registry.accounts:
-                continue
-
-            # Create new account
-            account = InternationalAccount(
-                account_holder=account_holder,
+        # Bake the bank prefix in so only the random fields are formatted
+        fill = template.replace("{prefix}", bank_info["prefix"]).format
+
+        # Pool unique candidate numbers and drop any already in the registry
+        candidates = set()
+        while len(candidates) < ACCOUNTS_PER_BANK:
+            candidates.update(
+                fill(*starmap(randint, ranges)) for _ in range(ACCOUNTS_PER_BANK * 2)
+            )
+            candidates -= registry.accounts.keys()
+        account_numbers = list(candidates)[:ACCOUNTS_PER_BANK]
+
+        firsts = choices(names["first"], k=ACCOUNTS_PER_BANK)
+        lasts = choices(names["last"], k=ACCOUNTS_PER_BANK)
+
+        # Create the bank's accounts and merge them in one update
+        new_accounts = {
+            account_number: InternationalAccount(
+                account_holder=f"{first_name} {last_name}",
                 account_number=account_number,
                 bank_name=bank_info["name"],
                 swift_code=bank_info["swift"],
                 country=country,
                 currency=bank_info["currency"],
-                balance=round(random.uniform(50000, 500000), 2),
+                balance=round(rng.uniform(50000, 500000), 2),
             )
+            for account_number, first_name, last_name in zip(
+                account_numbers, firsts, lasts
+            )
+        }
 
-            registry.accounts[account_number] = account
-            accounts_added += 1
-            bank_accounts += 1
+        registry.accounts.update(new_accounts)
+        accounts_added += len(new_accounts)
 
-        print(f"   ✓ {bank_info['name']:<45} Added {bank_accounts} accounts")
+        out.append(f"   ✓ {bank_info['name']:<45} Added {len(new_accounts)} accounts")
 
-print(f"\n✅ Successfully added {accounts_added} new accounts!")
+out.append(f"\n✅ Successfully added {accounts_added} new accounts!")
+sys.stdout.write("\n".join(out) + "\n")
 
 # Save updated registry
 print("\nSaving to file...")
@@ -341,14 +357,20 @@ DataStore.save_international_accounts(registry, verbose=True)
 
 final_count = len(registry.accounts)
 
-print("\n" + "=" * 80)
-print("SUMMARY")
-print("=" * 80)
-print(f"Initial accounts:  {initial_count}")
-print(f"New accounts:      +{accounts_added}")
-print(f"Final total:       {final_count}")
-print("=" * 80)
-
-print("\n✅ Dataset synchronized with InternationalBankRegistry!")
-print("✓ All existing transfers and history preserved!")
-print("✓ Run this script anytime you add banks to InternationalBankRegistry.py")
+sys.stdout.write(
+    "\n".join(
+        [
+            "\n" + "=" * 80,
+            "SUMMARY",
+            "=" * 80,
+            f"Initial accounts:  {initial_count}",
+            f"New accounts:      +{accounts_added}",
+            f"Final total:       {final_count}",
+            "=" * 80,
+            "\n✅ Dataset synchronized with InternationalBankRegistry!",
+            "✓ All existing transfers and history preserved!",
+            "✓ Run this script anytime you add banks to InternationalBankRegistry.py",
+        ]
+    )
+    + "\n"
+)
@@ -1,4 +1,11 @@
-from typing import List, Optional, Tuple
+import math
+import os
+import sys
+from contextlib import contextmanager
+from datetime import date
+from itertools import count, islice
+from operator import attrgetter
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from Account import Account
 from BankClock import BankClock
@@ -14,12 +21,39 @@ from Transaction import Transaction
 class Bank:
     """Bank class for managing customers, accounts, loans, and cards"""
 
+    # Transaction type -> transfer mode shown on cheque details
+    _MODE_BY_TYPE = {
+        "NEFT_SENT": "NEFT",
+        "NEFT_RECEIVED": "NEFT",
+        "RTGS_SENT": "RTGS",
+        "RTGS_RECEIVED": "RTGS",
+        "INTER_ACCOUNT_SENT": "Inter-Account",
+        "INTER_ACCOUNT_RECEIVED": "Inter-Account",
+    }
+
+    # Collections written by save(); mutators name only the ones they touched
+    _SAVE_GROUPS = ("accounts", "customers", "loans", "international")
+
     def __init__(self):
         self.accounts: List[Account] = []
         self.customers: List[Customer] = []
         self.loans: List[Loan] = []
         self.credit_cards: List[CreditCard] = []  # Initialize credit cards list
+        self._accounts_by_number: Dict[str, Account] = {}
+        self._accounts_by_type: Dict[str, List[Account]] = {}
+        self._accounts_by_customer: Dict[str, List[Account]] = {}
+        self._customers_by_username: Dict[str, Customer] = {}
+        self._customers_by_id: Dict[str, Customer] = {}
+        self._loans_by_id: Dict[str, Loan] = {}
+        self._loans_by_customer: Dict[str, List[Loan]] = {}
+        # Transaction lookups, filled lazily by _refresh_txn_index
+        self._txn_index: Dict[str, Tuple[Account, Transaction]] = {}
+        self._cheque_index: Dict[str, Tuple[Account, Transaction]] = {}
+        self._txn_indexed: Dict[Account, Tuple[List[Transaction], int]] = {}
+        self._txn_seq = None  # next "TXN" id number, seeded on first use
         self.international_registry = None  # ✅ FIXED: Removed ()
+        self._batch_depth = 0  # save() is deferred while > 0
+        self._unsaved = set()  # groups waiting for the end of a batch
         self.load()  # This will load everything including international registry
 
     def load(self):
@@ -28,9 +62,14 @@ class Bank:
         self.accounts = DataStore.load_accounts()
         self.customers = DataStore.load_customers()
         self.loans = DataStore.load_loans()
+        self._build_indexes()
 
         # ✅ ADD THIS: Load international accounts
+        registry_saved = os.path.exists(DataStore.INTERNATIONAL_JSON_PATH)
         self.international_registry = DataStore.load_international_accounts()
+        if not registry_saved:
+            # A new registry gets random account numbers; keep them for next run
+            self.save("international")
 
         print(f"✓ Loaded {len(self.accounts)} accounts")
         print(f"✓ Loaded {len(self.customers)} customers")
@@ -40,18 +79,96 @@ class Bank:
                 f"✓ Loaded {len(self.international_registry.accounts)} international accounts"
             )
 
-    def save(self):
-        """Save all accounts, customers, and loans to persistent storage"""
-        DataStore.save_accounts(self.accounts)
-        DataStore.save_customers(self.customers)
-        DataStore.save_loans(self.loans)
+    def _build_indexes(self):
+        """Rebuild the lookup dicts over accounts, customers and loans"""
+        self._accounts_by_number = {}
+        self._accounts_by_type = {}
+        self._accounts_by_customer = {}
+        for account in self.accounts:
+            self._index_account(account)
+        self._customers_by_username = {}
+        self._customers_by_id = {}
+        for customer in self.customers:
+            self._index_customer(customer)
+        self._loans_by_id = {}
+        self._loans_by_customer = {}
+        for loan in self.loans:
+            self._index_loan(loan)
+        self._txn_index = {}
+        self._cheque_index = {}
+        self._txn_indexed = {}
+        self._txn_seq = None
+
+    def _index_customer(self, customer: Customer):
+        # First customer wins on a duplicate key, matching the old linear search
+        self._customers_by_username.setdefault(customer.username, customer)
+        self._customers_by_id.setdefault(customer.customer_id, customer)
+
+    def _index_account(self, account: Account):
+        # First account wins on a duplicate number, matching the old linear search
+        self._accounts_by_number.setdefault(account.account_number, account)
+        self._accounts_by_type.setdefault(account.account_type, []).append(account)
+        self._accounts_by_customer.setdefault(account.customer_id, []).append(
+            account
+        )
+
+    def _index_loan(self, loan: Loan):
+        # First loan wins on a duplicate id, matching the old linear search
+        self._loans_by_id.setdefault(loan.loan_id, loan)
+        self._loans_by_customer.setdefault(loan.customer_id, []).append(loan)
+
+    def save(self, *groups: str):
+        """
+        Save accounts, customers, loans and international accounts
+
+        Args:
+            *groups: Names from _SAVE_GROUPS to write; all of them when omitted
+        """
+        self._unsaved.update(groups or self._SAVE_GROUPS)
+        if self._batch_depth:
+            return
+
+        pending, self._unsaved = self._unsaved, set()
+        if "accounts" in pending:
+            DataStore.save_accounts(self.accounts)
+        if "customers" in pending:
+            DataStore.save_customers(self.customers)
+        if "loans" in pending:
+            DataStore.save_loans(self.loans)
 
         # ✅ ADD THIS: Save international accounts
-        if hasattr(self, "international_registry") and self.international_registry:
+        if (
+            "international" in pending
+            and hasattr(self, "international_registry")
+            and self.international_registry
+        ):
             DataStore.save_international_accounts(
                 self.international_registry, verbose=False
             )
 
+    @contextmanager
+    def batch(self):
+        """
+        Defer saves and write everything once when the block exits
+
+        Batches may be nested; the groups passed to save() inside the block
+        are written together when the outermost one exits. Activity log rows
+        are buffered for the same span.
+
+        Example:
+            with bank.batch():
+                for row in rows:
+                    bank.register_customer(...)
+        """
+        self._batch_depth += 1
+        try:
+            with DataStore.batch():
+                yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._unsaved:
+                self.save(*self._unsaved)
+
     def save_data(self):
         """Alias for save() method for compatibility"""
         self.save()
@@ -59,17 +176,13 @@ class Bank:
     # ========== AUTHENTICATION AND REGISTRATION ==========
 
     def authenticate(self, username: str, password: str) -> Optional[Customer]:
-        for customer in self.customers:
-            if (
-                customer.username == username
-                and customer.password == password
-                and not customer.locked
-            ):
-                return customer
+        customer = self._customers_by_username.get(username)
+        if customer and customer.password == password and not customer.locked:
+            return customer
         return None
 
     def username_exists(self, username: str) -> bool:
-        return any(cust.username == username for cust in self.customers)
+        return username in self._customers_by_username
 
     def register_customer(
         self,
@@ -108,7 +221,9 @@ class Bank:
         )
         self.customers.append(customer)
         self.accounts.append(account)
-        self.save()
+        self._index_customer(customer)
+        self._index_account(account)
+        self.save("customers", "accounts")
         return (customer, account)
 
     def add_account_to_customer(self, customer: Customer, account_type: str) -> Account:
@@ -124,94 +239,158 @@ class Bank:
         )
         customer.add_account(account.account_number)
         self.accounts.append(account)
-        self.save()
+        self._index_account(account)
+        self.save("customers", "accounts")
         return account
 
     # ========== CUSTOMER MANAGEMENT ==========
 
     def get_customer(self, username: str) -> Optional[Customer]:
-        for customer in self.customers:
-            if customer.username == username:
-                return customer
-        return None
+        return self._customers_by_username.get(username)
 
     def get_customer_by_id(self, customer_id: str) -> Optional[Customer]:
-        for customer in self.customers:
-            if customer.customer_id == customer_id:
-                return customer
-        return None
+        return self._customers_by_id.get(customer_id)
 
     def get_customer_accounts(self, customer: Customer) -> List[Account]:
-        account_numbers = customer.get_account_numbers()
-        customer_accounts = []
-        for acc_num in account_numbers:
-            account = self.get_account(acc_num)
-            if account:
-                customer_accounts.append(account)
-        return customer_accounts
+        accounts_by_number = self._accounts_by_number
+        return [
+            accounts_by_number[acc_num]
+            for acc_num in customer.get_account_numbers()
+            if acc_num in accounts_by_number
+        ]
 
     # ========== ACCOUNT MANAGEMENT ==========
 
     def get_account(self, account_number: str) -> Optional[Account]:
-        for account in self.accounts:
-            if account.account_number == account_number:
-                return account
-        return None
+        return self._accounts_by_number.get(account_number)
 
     def find_account_by_number(self, account_number: str) -> Optional[Account]:
         return self.get_account(account_number)
 
+    def remove_account(self, account: Account):
+        """Remove a closed account from the bank's active accounts"""
+        try:
+            self.accounts.remove(account)
+        except ValueError:
+            pass
+        number = account.account_number
+        if self._accounts_by_number.get(number) is account:
+            del self._accounts_by_number[number]
+            # Expose the next account with the same number, as the scan would
+            for other in self.accounts:
+                if other.account_number == number:
+                    self._accounts_by_number[number] = other
+                    break
+        for bucket, key in (
+            (self._accounts_by_type, account.account_type),
+            (self._accounts_by_customer, account.customer_id),
+        ):
+            try:
+                bucket[key].remove(account)
+            except (KeyError, ValueError):
+                pass
+        # Forget the closed account's transactions
+        if self._txn_indexed.pop(account, None) is not None:
+            for txn in account.transactions:
+                if self._txn_index.get(txn.id, (None,))[0] is account:
+                    del self._txn_index[txn.id]
+                if self._cheque_index.get(txn.cheque_id, (None,))[0] is account:
+                    del self._cheque_index[txn.cheque_id]
+
     def are_same_customer_accounts(self, acc1: Account, acc2: Account) -> bool:
-        return (
-            acc1.customer_id == acc2.customer_id
-            and acc1.customer_id
-            and acc1.customer_id != ""
-        )
+        customer_id = acc1.customer_id
+        return bool(customer_id) and customer_id == acc2.customer_id
 
     # ========== TRANSACTION MANAGEMENT ==========
 
+    def _next_txn_id(self) -> str:
+        """Next bank-issued "TXN" id, above every one already on record"""
+        if self._txn_seq is None:
+            last = max(
+                (
+                    int(txn.id[3:])
+                    for account in self.accounts
+                    for txn in account.transactions
+                    if txn.id.startswith("TXN") and txn.id[3:].isdigit()
+                ),
+                default=0,
+            )
+            self._txn_seq = count(last + 1)
+        return f"TXN{next(self._txn_seq):012d}"
+
+    def _refresh_txn_index(self):
+        """
+        Index transactions appended since the last refresh
+
+        Transaction lists are append-only, so only the tail past the last
+        indexed position is scanned. A replaced list is indexed from the start.
+        """
+        indexed = self._txn_indexed
+        for account in self.accounts:
+            transactions = account.transactions
+            seen, count = indexed.get(account, (None, 0))
+            if seen is not transactions or count > len(transactions):
+                count = 0
+            elif count == len(transactions):
+                continue
+            for transaction in islice(transactions, count, None):
+                self._index_txn(account, transaction)
+            indexed[account] = (transactions, len(transactions))
+
+    def _index_txn(self, account: Account, txn: Transaction):
+        self._txn_index.setdefault(txn.id, (account, txn))
+        if txn.cheque_id is not None and txn.type.endswith("_SENT"):
+            self._cheque_index.setdefault(txn.cheque_id, (account, txn))
+
+    def _record_txn(self, account: Account, txn: Transaction):
+        """
+        Append a transaction to an account and index it straight away
+
+        If the account's earlier transactions are not indexed yet, the next
+        refresh picks this one up with them.
+        """
+        transactions = account.transactions
+        transactions.append(txn)
+        seen, count = self._txn_indexed.get(account, (None, 0))
+        if seen is transactions and count == len(transactions) - 1:
+            self._index_txn(account, txn)
+            self._txn_indexed[account] = (transactions, count + 1)
+
+    def _lookup_txn(
+        self, index: Dict[str, Tuple[Account, Transaction]], key: str
+    ) -> Optional[Tuple[Account, Transaction]]:
+        result = index.get(key)
+        if result is None:
+            self._refresh_txn_index()
+            result = index.get(key)
+        return result
+
     def search_transaction_by_id(
         self, txn_id: str
     ) -> Optional[Tuple[Account, Transaction]]:
-        for account in self.accounts:
-            for transaction in account.transactions:
-                if transaction.id == txn_id:
-                    return (account, transaction)
-        return None
+        return self._lookup_txn(self._txn_index, txn_id)
 
     def search_transaction_by_cheque_id(
         self, cheque_id: str
     ) -> Optional[Tuple[Account, Transaction]]:
-        for account in self.accounts:
-            for transaction in account.transactions:
-                if transaction.cheque_id == cheque_id and transaction.type.endswith(
-                    "_SENT"
-                ):
-                    return (account, transaction)
-        return None
+        return self._lookup_txn(self._cheque_index, cheque_id)
 
     def show_cheque_details(self, cheque_id: str):
         result = self.search_transaction_by_cheque_id(cheque_id)
         if result:
             sender_acc, txn = result
-            print("\n=== Cheque Details ===")
-            print(f"Cheque ID: {cheque_id}")
-            print(f"Sender Name: {sender_acc.first_name} {sender_acc.last_name}")
-            print(f"Sender Account Number: {sender_acc.account_number}")
-            print(f"Sender IFSC: {Account.BRANCH_IFSC}")
-            print(f"Sender Branch: {Account.BRANCH_NAME}")
-            print(f"Amount Transferred: ₹{txn.amount:.2f}")
-            if txn.type.startswith("NEFT"):
-                mode = "NEFT"
-            elif txn.type.startswith("RTGS"):
-                mode = "RTGS"
-            elif txn.type.startswith("INTER_ACCOUNT"):
-                mode = "Inter-Account"
-            else:
-                mode = "Other"
-            print(f"Transfer Mode: {mode}")
-            print(f"Timestamp: {txn.timestamp}")
-            print(f"Transaction ID: {txn.id}")
+            sys.stdout.write(
+                "\n=== Cheque Details ===\n"
+                f"Cheque ID: {cheque_id}\n"
+                f"Sender Name: {sender_acc.first_name} {sender_acc.last_name}\n"
+                f"Sender Account Number: {sender_acc.account_number}\n"
+                f"Sender IFSC: {Account.BRANCH_IFSC}\n"
+                f"Sender Branch: {Account.BRANCH_NAME}\n"
+                f"Amount Transferred: ₹{txn.amount:.2f}\n"
+                f"Transfer Mode: {self._MODE_BY_TYPE.get(txn.type, 'Other')}\n"
+                f"Timestamp: {txn.timestamp}\n"
+                f"Transaction ID: {txn.id}\n"
+            )
         else:
             print(f"❌ No transaction found for Cheque ID: {cheque_id}")
 
@@ -224,34 +403,53 @@ class Bank:
         return len(self.customers)
 
     def get_total_balance(self) -> float:
-        return sum(account.balance for account in self.accounts)
+        # Summed on demand: balances change inside Account, Card, SalaryProfile
+        # and DataStore replay, so a running total kept here would drift
+        # fsum keeps the total exact to the paisa over many float balances
+        return math.fsum(map(attrgetter("balance"), self.accounts))
 
     def get_accounts_by_type(self, account_type: str) -> List[Account]:
-        return [
-            account for account in self.accounts if account.account_type == account_type
-        ]
+        return list(self._accounts_by_type.get(account_type, ()))
+
+    def iter_accounts_by_type(self, account_type: str) -> Iterator[Account]:
+        """
+        Iterate accounts of one type without copying the index bucket
+
+        Do not open or close accounts while iterating; use
+        get_accounts_by_type() for a snapshot instead.
+        """
+        return iter(self._accounts_by_type.get(account_type, ()))
 
     def get_minor_accounts(self) -> List[Account]:
-        return [
-            account for account in self.accounts if account.account_type == "Future"
-        ]
+        return self.get_accounts_by_type("Future")
 
     # ========== LOAN MANAGEMENT ==========
 
-    def add_loan(self, loan: Loan):
-        """Add a new loan to the bank and persist."""
+    def add_loan(self, loan: Loan, save: bool = True):
+        """Add a new loan to the bank and persist (unless the caller saves)."""
         self.loans.append(loan)
-        DataStore.save_loans(self.loans)
+        self._index_loan(loan)
+        if save:
+            self.save("loans")
 
     def get_loans_for_customer(self, customer_id: str) -> List[Loan]:
         """Retrieve all loans for a given customer_id."""
-        return [loan for loan in self.loans if loan.customer_id == customer_id]
+        return list(self._loans_by_customer.get(customer_id, ()))
+
+    def iter_loans_for_customer(self, customer_id: str) -> Iterator[Loan]:
+        """
+        Iterate a customer's loans without copying the index bucket
+
+        Do not add loans while iterating; use get_loans_for_customer() for a
+        snapshot instead.
+        """
+        return iter(self._loans_by_customer.get(customer_id, ()))
 
     def pay_emi_for_loan(self, loan_id: str, account_number: str):
         """
         Process EMI payment for a loan, debiting account balance and updating loan.
         """
-        loan = next((ln for ln in self.loans if ln.loan_id == loan_id), None)
+        loan = self._loans_by_id.get(loan_id)
         account = self.get_account(account_number)
         if not loan or not account:
             print("Invalid loan or account.")
@@ -262,38 +460,48 @@ class Bank:
             print("Insufficient balance to pay EMI.")
             return
 
-        # Update loan and account
+        receipt = self._debit_emi(
+            loan, account, emi_amount, BankClock.get_iso_datetime()
+        )
+        if self._close_loan_if_repaid(loan):
+            print("Loan fully repaid and closed.")
+        self.save("accounts", "loans")
+        print(receipt)
+
+    def _debit_emi(
+        self, loan: Loan, account: Account, emi_amount: float, timestamp: str
+    ) -> str:
+        """Debit one EMI and record its transaction; returns the receipt line"""
         account.balance -= emi_amount
         loan.emis_paid += 1
 
-        if loan.emis_paid >= loan.tenure_months:
-            loan.status = "Closed"
-            loan.closure_date = BankClock.today()
-            print("Loan fully repaid and closed.")
-
         # Log transaction
-        ts = BankClock.get_formatted_datetime()
         txn_id = f"EMI{loan.loan_id}{loan.emis_paid:02d}"
         txn = Transaction(
             id=txn_id,
             type="LOAN_EMI",
             amount=emi_amount,
             resulting_balance=account.balance,
-            timestamp=ts,
+            timestamp=timestamp,
             cheque_id=None,
             metadata=f"loan_id={loan.loan_id};emi_no={loan.emis_paid}",
         )
-        account.transactions.append(txn)
-        self.save()
-        print(
-            f"EMI of Rs.{emi_amount} paid for loan {loan.loan_id}. Remaining EMIs: {loan.tenure_months - loan.emis_paid}"
-        )
+        self._record_txn(account, txn)
+        return f"EMI of Rs.{emi_amount} paid for loan {loan.loan_id}. Remaining EMIs: {loan.tenure_months - loan.emis_paid}"
+
+    def _close_loan_if_repaid(self, loan: Loan) -> bool:
+        """Mark the loan closed once every EMI is paid"""
+        if loan.emis_paid >= loan.tenure_months:
+            loan.status = "Closed"
+            loan.closure_date = BankClock.today()
+            return True
+        return False
 
     def pay_multiple_emis_for_loan(self, loan_id: str, account_number: str, count: int):
         """
         Process payment for multiple EMIs at once, if sufficient balance.
         """
-        loan = next((ln for ln in self.loans if ln.loan_id == loan_id), None)
+        loan = self._loans_by_id.get(loan_id)
         account = self.get_account(account_number)
         if not loan or not account:
             print("Invalid loan or account.")
@@ -312,25 +520,35 @@ class Bank:
             )
             return
 
-        for _ in range(count):
-            self.pay_emi_for_loan(loan_id, account_number)
+        # Balance is already checked for the whole batch: debit every EMI,
+        # then settle closure, save and report once
+        ts = BankClock.get_iso_datetime()
+        receipts = [
+            self._debit_emi(loan, account, emi_amount, ts) for _ in range(count)
+        ]
+        if self._close_loan_if_repaid(loan):
+            receipts.append("Loan fully repaid and closed.")
+        self.save("accounts", "loans")
+        if receipts:
+            sys.stdout.write("\n".join(receipts) + "\n")
 
     def show_loans_for_customer(self, customer_id: str):
         loans = self.get_loans_for_customer(customer_id)
         if not loans:
             print("No loans found for this customer.")
             return
-        print("\n=== Loan Summary ===")
+        lines = ["\n=== Loan Summary ==="]
         for loan in loans:
-            print(
+            lines.append(
                 f"Loan ID: {loan.loan_id} | Principal: ₹{loan.principal:.2f} | EMI: ₹{loan.calculate_emi():.2f} | Tenure: {loan.tenure_months} months"
             )
-            print(
+            lines.append(
                 f"Status: {loan.status} | EMIs Paid: {loan.emis_paid}/{loan.tenure_months}"
             )
-            if getattr(loan, "approval_reason", None):
-                print(f"Notes: {loan.approval_reason}")
-            print("")
+            if loan.approval_reason:
+                lines.append(f"Notes: {loan.approval_reason}")
+            lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def evaluate_and_add_loan(
         self,
@@ -349,8 +567,6 @@ class Bank:
         if not approved:
             return False, None, reason
 
-        from datetime import datetime
-
         loan_id = f"LOAN{len(self.loans) + 1:06d}"
 
         loan = Loan(
@@ -369,25 +585,23 @@ class Bank:
         account.balance += principal
 
         # Create transaction record for loan disbursement
-        timestamp_int = int(datetime.now().timestamp())
-        txn_id = f"TXN{timestamp_int}{len(account.transactions):04d}"
-
         loan_disbursement = Transaction(
-            id=txn_id,
+            id=self._next_txn_id(),
             type="LOAN_CREDIT",
             amount=principal,
             resulting_balance=account.balance,
-            timestamp=BankClock.get_formatted_datetime(),
+            timestamp=BankClock.get_iso_datetime(),
             cheque_id=None,
             metadata=f"loan_id={loan_id};principal={principal:.2f};tenure={tenure_months}months;rate={interest_rate}%",
         )
-        account.transactions.append(loan_disbursement)
+        self._record_txn(account, loan_disbursement)
 
-        # Add loan to bank's loan list
-        self.add_loan(loan)
+        # Add loan to bank's loan list (persisted by the save below)
+        self.add_loan(loan, save=False)
 
-        # Save everything
-        self.save()
+        # Save the credited account and the new loan, plus the customer:
+        # apply_for_loan fills in the loan profile and score before calling
+        self.save("accounts", "customers", "loans")
 
         print("\n✅ Loan Disbursed!")
         print(f"Loan ID: {loan_id}")
@@ -401,19 +615,18 @@ class Bank:
 
     def get_credit_cards_for_customer(self, customer_id: str) -> List[CreditCard]:
         """Get all credit cards for a specific customer"""
-        all_cards = []
-        for account in self.accounts:
-            if account.customer_id == customer_id:
-                for card in account.cards:
-                    if isinstance(card, CreditCard):
-                        all_cards.append(card)
-        return all_cards
+        return [
+            card
+            for account in self._accounts_by_customer.get(customer_id, ())
+            for card in account.cards
+            if isinstance(card, CreditCard)
+        ]
 
     def issue_debit_card(self, customer: Customer, account: Account) -> DebitCard:
         """Issue a new debit card for an account"""
         debit_card = DebitCard(customer.customer_id, account.account_number)
         account.add_card(debit_card)
-        self.save()
+        self.save("accounts")
         return debit_card
 
     def issue_credit_card(
@@ -422,25 +635,20 @@ class Bank:
         """Issue a new credit card for an account"""
         if credit_limit is None:
             # Calculate credit limit using CreditEvaluator
-            from datetime import datetime
-
-            dob = datetime.strptime(customer.dob, "%Y-%m-%d")
-            age = (datetime.now() - dob).days // 365
+            age = (date.today() - customer.dob_date).days // 365
 
-            if hasattr(customer, "salary") and customer.salary:
+            if customer.salary:
                 annual_income = customer.salary * 12
             else:
                 annual_income = 180000  # Default minimum
 
-            cibil_score = getattr(customer, "cibil_score", 650)
-
             credit_limit = CreditEvaluator.calculate_credit_limit(
-                cibil_score=cibil_score,
+                cibil_score=customer.cibil_score,
                 annual_income=annual_income,
                 age=age,
                 existing_debt=0.0,
-                employer_category=getattr(customer, "employer_category", "pvt"),
-                has_salary_account=getattr(customer, "has_salary_account", False),
+                employer_category=customer.employer_category,
+                has_salary_account=customer.has_salary_account,
             )
 
         credit_card = CreditCard(
@@ -449,8 +657,6 @@ class Bank:
         account.add_card(credit_card)
 
         # Link card info under customer for utilization tracking
-        if not hasattr(customer, "credit_cards"):
-            customer.credit_cards = []
         customer.credit_cards.append(
             {
                 "card_id": credit_card.card_id,
@@ -460,7 +666,7 @@ class Bank:
             }
         )
 
-        self.save()
+        self.save("accounts", "customers")
         print(
             f"Credit card issued with limit: Rs. {credit_limit:,}, Number: {credit_card.card_number}"
         )
@@ -475,35 +681,59 @@ class Bank:
         print(f"\n{'=' * 60}")
         print(f"Processing Daily Tasks for {today.strftime('%d-%m-%Y')}")
         print(f"{'=' * 60}\n")
+        # Activity rows from every account are written together at the end
         total_processed = 0
-
-        for account in self.accounts:
-            # Process recurring bills (returns number processed for the account)
-            bills_processed = account.process_recurring_bills(today, self)
-            total_processed += bills_processed
-
-            # Process salary credits
-            if account.salary_profile and account.salary_profile.should_credit_today(
-                today
-            ):
-                print(f"  💰 Crediting salary for {account.username}")
-                success, msg = account.salary_profile.credit_salary(account)
-                print(f"  Result: {msg}")
-            else:
-                if account.salary_profile:
-                    print(
-                        f"  ⏭️  Skipping salary for {account.username} (not due today or already processed)"
-                    )
-
-            # Process credit card bills
-            account.process_credit_card_bills(today)
-
-        self.save()
+        changed = False
+        with DataStore.batch():
+            for account in self.accounts:
+                # Skip accounts with nothing scheduled for today's date
+                if not account.has_daily_tasks(today):
+                    continue
+                bills_processed, account_changed = self._process_account_daily_tasks(
+                    account, today
+                )
+                total_processed += bills_processed
+                changed = changed or account_changed
+
+        # Nothing was billed or credited: the saved data is already current
+        if changed:
+            self.save("accounts")
         print(f"\n{'=' * 60}")
         print("Daily tasks completed")
         print(f"{'=' * 60}\n")
 
         return total_processed
 
+    def _process_account_daily_tasks(
+        self, account: Account, today
+    ) -> Tuple[int, bool]:
+        """
+        Run one account's daily tasks
+
+        Returns:
+            (bills processed, whether any task changed account data)
+        """
+        # Process recurring bills (returns number processed for the account)
+        bills_processed = account.process_recurring_bills(today, self)
+        changed = bills_processed > 0
+
+        # Process salary credits
+        salary_profile = account.salary_profile
+        if salary_profile and salary_profile.should_credit_today(today):
+            print(f"  💰 Crediting salary for {account.username}")
+            success, msg = salary_profile.credit_salary(account)
+            print(f"  Result: {msg}")
+            changed = True
+        elif salary_profile:
+            print(
+                f"  ⏭️  Skipping salary for {account.username} (not due today or already processed)"
+            )
+
+        # Process credit card bills
+        if account.process_credit_card_bills(today):
+            changed = True
+
+        return bills_processed, changed
+
 
 # End of Bank class
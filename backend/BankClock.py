@@ -11,6 +11,9 @@ class BankClock:
     _datetime_format = "%d-%m-%Y %H:%M:%S"
     _date_format = "%d-%m-%Y"
     _time_format = "%H:%M:%S"
+    _formatted_datetime_cache = (None, "")  # (datetime it was formatted from, text)
+    _iso_datetime_cache = (None, "")
+    _login_banner_cache = (None, "")
     
     @classmethod
     def now(cls) -> datetime:
@@ -40,7 +43,43 @@ class BankClock:
         Returns:
             Formatted string in "dd-MM-yyyy HH:mm:ss" format
         """
-        return cls._virtual_datetime.strftime(cls._datetime_format)
+        # The virtual clock only moves when advanced or set, so the same
+        # string is reused for every transaction stamped at this instant
+        cached_for, formatted = cls._formatted_datetime_cache
+        if cached_for != cls._virtual_datetime:
+            formatted = cls._virtual_datetime.strftime(cls._datetime_format)
+            cls._formatted_datetime_cache = (cls._virtual_datetime, formatted)
+        return formatted
+    
+    @classmethod
+    def get_iso_datetime(cls) -> str:
+        """
+        Gets ISO-8601 date-time string used for stored timestamps
+        
+        Returns:
+            Formatted string in "yyyy-MM-dd HH:mm:ss" format
+        """
+        cached_for, formatted = cls._iso_datetime_cache
+        if cached_for != cls._virtual_datetime:
+            formatted = cls._virtual_datetime.isoformat(sep=" ", timespec="seconds")
+            cls._iso_datetime_cache = (cls._virtual_datetime, formatted)
+        return formatted
+    
+    @staticmethod
+    def to_iso_datetime(timestamp: str) -> str:
+        """
+        Convert a legacy "dd-mm-yyyy HH:MM:SS" timestamp to ISO-8601
+        
+        Args:
+            timestamp: Timestamp in either legacy or ISO format
+            
+        Returns:
+            Timestamp in "yyyy-mm-dd HH:MM:SS" format (unchanged if already ISO)
+        """
+        if timestamp and len(timestamp) >= 10 and timestamp[2] == "-":
+            day, month, year = timestamp[0:2], timestamp[3:5], timestamp[6:10]
+            return f"{year}-{month}-{day}{timestamp[10:]}"
+        return timestamp
     
     @classmethod
     def get_formatted_date(cls) -> str:
@@ -121,8 +160,12 @@ class BankClock:
         Returns:
             Multi-line formatted string with date and time
         """
-        return f"""Current Date: {cls.get_formatted_date()}
+        cached_for, banner = cls._login_banner_cache
+        if cached_for != cls._virtual_datetime:
+            banner = f"""Current Date: {cls.get_formatted_date()}
 Current Time: {cls.get_formatted_time()}"""
+            cls._login_banner_cache = (cls._virtual_datetime, banner)
+        return banner
     
     @classmethod
     def get_compact_display(cls) -> str:
@@ -1,5 +1,7 @@
+import sys
 from datetime import date
-from typing import List
+from functools import lru_cache
+from typing import Collection, List, Tuple
 
 from Account import Account
 from Bank import Bank
@@ -13,30 +15,139 @@ from ExpenseSimulator import ExpenseSimulator
 from RecurringBill import PaymentMethod, RecurringBill, RecurringBillFactory
 
 
+def _prompt(message: str) -> str:
+    """
+    Show a prompt and read one line of input
+
+    Interactive terminals keep input() for line editing; piped or scripted
+    sessions read straight from the buffered stdin instead. Raises EOFError
+    at end of input, like input().
+    """
+    if sys.stdin.isatty():
+        return input(message)
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+# Section rule used by the simulation and bill screens
+_EQ60 = "=" * 60
+
+
+@lru_cache(maxsize=64)
+def _numeric_choices(count: int) -> frozenset:
+    """Valid answers "1".."count" for a numbered list prompt"""
+    return frozenset(str(i) for i in range(1, count + 1))
+
+
+@lru_cache(maxsize=1)
+def _common_bills_menu() -> Tuple[str, int]:
+    """Rendered bill-template menu and the number of templates it lists"""
+    common_bills = RecurringBillFactory.COMMON_BILLS
+    rows = ["\nCommon bills:"]
+    for idx, (name, cat, min_amt, max_amt, freq) in enumerate(common_bills, 1):
+        rows.append(
+            f"{idx}. {name} ({cat}) - Rs. {min_amt:.2f}-Rs. {max_amt:.2f} [{freq}]"
+        )
+    rows.append(f"{len(common_bills) + 1}. Custom Bill")
+    return "\n".join(rows), len(common_bills)
+
+
 class BankingApp:
     """Main banking application with CLI interface"""
 
+    # Account menu text; only the date/time line changes between rounds
+    _ACCOUNT_MENU = """
+Current Date/Time: {now}
+
+Choose an option:
+1   View Balance
+2   Deposit Money
+3   Withdraw Money
+4   Transfer Funds (NEFT/RTGS/Inter-Account)
+5   View Transaction History
+6   Search Transaction by ID
+7   Switch Account
+8   Create Additional Account
+9   Manage Recurring Bills
+10  Manage Salary
+11  Simulate Time (Fast Forward)
+12  View Expense Analysis
+13  Loan Menu
+14  Card Management
+15  Close Card
+16  Close Account
+17  Logout
+        """
+    _ACCOUNT_MENU_CHOICES = _numeric_choices(17)
+
+    # Static tail of the CIBIL report, joined once
+    _CIBIL_RANGE_GUIDE = "\n".join(
+        (
+            "\n" + "-" * 70,
+            "SCORE RANGE GUIDE",
+            "-" * 70,
+            "  300-549: Poor       - High risk, loans often denied",
+            "  550-649: Average    - Moderate risk, limited options",
+            "  650-749: Good       - Low risk, favorable terms",
+            "  750-900: Excellent  - Best rates and quick approvals",
+        )
+    )
+
+    # Loan profile details asked for when missing: (attribute, prompt, reader)
+    _LOAN_PROFILE_FIELDS = (
+        ("salary", "Enter your Net Monthly Salary: ", "read_positive_double"),
+        ("employer_name", "Enter your Employer Name: ", "read_text"),
+        ("employer_type", "Type of Employer [MNC/Govt/Pvt]: ", "read_text"),
+        ("job_start_date", "Job Start Date (YYYY-MM-DD): ", "read_date"),
+        ("employer_category", "Employer Category (A/B/C): ", "read_upper_text"),
+        ("city", "Working City: ", "read_text"),
+        ("kyc_completed", "Is your KYC complete? (y/n): ", "read_yes_no"),
+    )
+
     def __init__(self):
         self.bank = Bank()
         self.running = True
 
     @staticmethod
-    def read_date(prompt: str) -> str:
-        """Read and validate a date in YYYY-MM-DD format"""
+    def read_text(prompt: str) -> str:
+        """Read a line of free text with surrounding whitespace removed"""
+        return _prompt(prompt).strip()
+
+    @staticmethod
+    def read_upper_text(prompt: str) -> str:
+        """Read a line of free text, upper-cased"""
+        return _prompt(prompt).strip().upper()
+
+    @staticmethod
+    def read_yes_no(prompt: str) -> bool:
+        """Read a y/n answer; anything but "y" counts as no"""
+        return _prompt(prompt).strip().lower() == "y"
+
+    @staticmethod
+    def read_date_value(prompt: str) -> date:
+        """Read a date in YYYY-MM-DD format and return it parsed"""
         while True:
-            user_input = input(prompt).strip()
+            user_input = _prompt(prompt).strip()
             try:
-                date.fromisoformat(user_input)
-                return user_input
+                return date.fromisoformat(user_input)
             except ValueError:
                 print("Invalid date. Please use YYYY-MM-DD.")
 
+    @staticmethod
+    def read_date(prompt: str) -> str:
+        """Read and validate a date in YYYY-MM-DD format"""
+        return BankingApp.read_date_value(prompt).isoformat()
+
     @staticmethod
     def read_positive_double(prompt: str) -> float:
         """Read and validate a positive number"""
         while True:
             try:
-                value = float(input(prompt))
+                value = float(_prompt(prompt))
                 if value > 0:
                     return value
                 else:
@@ -48,7 +159,7 @@ class BankingApp:
     def read_valid_gender(prompt: str) -> str:
         """Read and validate gender input"""
         while True:
-            user_input = input(prompt).strip().lower()
+            user_input = _prompt(prompt).strip().lower()
             if user_input in ["male", "m"]:
                 return "Male"
             elif user_input in ["female", "f"]:
@@ -59,17 +170,33 @@ class BankingApp:
     @staticmethod
     def read_valid_choice(
         prompt: str,
-        valid_choices: list,
+        valid_choices: Collection[str],
         error_message: str = "Invalid choice. Please try again.",
     ) -> str:
         """Read and validate user choice from a list of valid options"""
         while True:
-            choice = input(prompt).strip()
+            choice = _prompt(prompt).strip()
             if choice in valid_choices:
                 return choice
             else:
                 print(error_message)
 
+    @staticmethod
+    def read_int_in_range(
+        prompt: str, low: int, high: int, error_message: str = None
+    ) -> int:
+        """Read a whole number between low and high (inclusive)"""
+        if error_message is None:
+            error_message = f"Please enter a number between {low} and {high}."
+        while True:
+            try:
+                value = int(_prompt(prompt))
+                if low <= value <= high:
+                    return value
+            except ValueError:
+                pass
+            print(error_message)
+
     @staticmethod
     def read_valid_account_type(prompt: str) -> str:
         """Read and validate account type selection"""
@@ -81,7 +208,7 @@ class BankingApp:
             "5": "Future",
         }
         while True:
-            choice = input(prompt).strip()
+            choice = _prompt(prompt).strip()
             if choice in account_types:
                 return account_types[choice]
             else:
@@ -91,7 +218,7 @@ class BankingApp:
     def read_valid_transfer_mode(prompt: str) -> str:
         """Read and validate transfer mode (NEFT/RTGS)"""
         while True:
-            choice = input(prompt).strip()
+            choice = _prompt(prompt).strip()
             if choice == "1":
                 return "NEFT"
             elif choice == "2":
@@ -106,8 +233,8 @@ class BankingApp:
         first_name = input("First Name: ").strip()
         last_name = input("Last Name: ").strip()
 
-        dob = self.read_date("Date of Birth (YYYY-MM-DD): ")
-        dob_date = date.fromisoformat(dob)
+        dob_date = self.read_date_value("Date of Birth (YYYY-MM-DD): ")
+        dob = dob_date.isoformat()
         today = date.today()
         age = (
             today.year
@@ -190,37 +317,34 @@ You can now login!
             print("No accounts found for this customer.")
             return
 
-        # Account selection
-        if len(accounts) > 1:
-            print(f"""
-Login Successful! 
+        # Greeting shared by both branches; several accounts add a picker
+        preamble = f"""
+Login Successful!
 
 {BankClock.get_login_banner()}
 
 Customer: {customer.first_name} {customer.last_name}
 Customer ID: {customer.customer_id}
+"""
 
-You have {len(accounts)} accounts. Please select one:
-            """)
-            for idx, acc in enumerate(accounts, 1):
-                print(
-                    f"{idx}. {acc.account_type} - {acc.account_number} (Balance: Rs. {acc.balance:.2f} INR)"
-                )
+        # Account selection
+        if len(accounts) > 1:
+            picker = "\n".join(
+                f"{idx}. {acc.account_type} - {acc.account_number} (Balance: Rs. {acc.balance:.2f} INR)"
+                for idx, acc in enumerate(accounts, 1)
+            )
+            sys.stdout.write(
+                f"{preamble}\nYou have {len(accounts)} accounts. Please select one:\n\n"
+                f"{picker}\n"
+            )
 
             choice = self.read_valid_choice(
                 f"Enter account number (1-{len(accounts)}): ",
-                [str(i) for i in range(1, len(accounts) + 1)],
+                _numeric_choices(len(accounts)),
             )
             selected_account = accounts[int(choice) - 1]
         else:
-            print(f"""
-Login Successful!
-
-{BankClock.get_login_banner()}
-
-Customer: {customer.first_name} {customer.last_name}
-Customer ID: {customer.customer_id}
-            """)
+            print(preamble)
             selected_account = accounts[0]
 
         # Account menu loop
@@ -230,34 +354,11 @@ Customer ID: {customer.customer_id}
         self, customer: Customer, accounts: List[Account], selected_account: Account
     ):
         """Display and handle account menu options"""
-        active = True
-
-        while active:
-            print(f"""
-Current Date/Time: {BankClock.get_formatted_datetime()}
-
-Choose an option:
-1   View Balance
-2   Deposit Money
-3   Withdraw Money
-4   Transfer Funds (NEFT/RTGS/Inter-Account)
-5   View Transaction History
-6   Search Transaction by ID
-7   Switch Account
-8   Create Additional Account
-9   Manage Recurring Bills
-10  Manage Salary
-11  Simulate Time (Fast Forward)
-12  View Expense Analysis
-13  Loan Menu
-14  Card Management
-15  Close Card
-16  Close Account
-17  Logout
-        """)
+        while True:
+            print(self._ACCOUNT_MENU.format(now=BankClock.get_formatted_datetime()))
             menu_choice = self.read_valid_choice(
                 "Enter your choice: ",
-                [str(i) for i in range(1, 18)],
+                self._ACCOUNT_MENU_CHOICES,
                 "Invalid choice. Please enter a number from 1 to 17.",
             )
 
@@ -297,10 +398,10 @@ Choose an option:
                 )
                 if closure_success:
                     # Account was closed, exit to main menu
-                    active = False
+                    return
             elif menu_choice == "17":
                 print("Logged out successfully.")
-                active = False
+                return
 
     # ========== CARD MANAGEMENT ==========
 
@@ -363,7 +464,6 @@ Choose an option:
 
     def request_credit_limit_enhancement(self, account: Account):
         """Request credit limit enhancement for a credit card"""
-        from Card import CreditCard
         from CreditLimitEnhancement import CreditLimitEnhancement
 
         credit_cards = [c for c in account.cards if isinstance(c, CreditCard)]
@@ -565,8 +665,6 @@ Choose an option:
 
     def apply_credit_card(self, account: Account):
         """Apply for a new credit card"""
-        from datetime import datetime
-
         print("\n--- Apply for Credit Card ---")
 
         # Show existing credit cards (if any)
@@ -600,8 +698,7 @@ Choose an option:
             return
 
         # Calculate age
-        dob = datetime.strptime(account.dob, "%Y-%m-%d")
-        age = (datetime.now() - dob).days // 365
+        age = (date.today() - customer.dob_date).days // 365
 
         # Get CIBIL score
         cibil_score = calculate_cibil_score(customer, self.bank)
@@ -648,16 +745,12 @@ Choose an option:
         network = network_map[network_choice]
 
         # Get billing day preference
-        while True:
-            billing_day = input("\nPreferred billing day (1-28): ").strip()
-            try:
-                billing_day = int(billing_day)
-                if 1 <= billing_day <= 28:
-                    break
-                else:
-                    print("Billing day must be between 1 and 28")
-            except ValueError:
-                print("Invalid input")
+        billing_day = self.read_int_in_range(
+            "\nPreferred billing day (1-28): ",
+            1,
+            28,
+            "Billing day must be between 1 and 28",
+        )
 
         credit_card = CreditCard(
             account.customer_id,
@@ -979,25 +1072,9 @@ Loan Menu:
 
     def apply_for_loan(self, customer: Customer, account: Account):
         print("\n=== Loan Application ===")
-        if not getattr(customer, "salary", None):
-            customer.salary = self.read_positive_double(
-                "Enter your Net Monthly Salary: "
-            )
-        if not getattr(customer, "employer_name", None):
-            customer.employer_name = input("Enter your Employer Name: ").strip()
-        if not getattr(customer, "employer_type", None):
-            customer.employer_type = input("Type of Employer [MNC/Govt/Pvt]: ").strip()
-        if not getattr(customer, "job_start_date", None):
-            customer.job_start_date = self.read_date("Job Start Date (YYYY-MM-DD): ")
-        if not getattr(customer, "employer_category", None):
-            customer.employer_category = (
-                input("Employer Category (A/B/C): ").strip().upper()
-            )
-        if not getattr(customer, "city", None):
-            customer.city = input("Working City: ").strip()
-        if not getattr(customer, "kyc_completed", None):
-            completed = input("Is your KYC complete? (y/n): ").strip().lower()
-            customer.kyc_completed = completed == "y"
+        for attr, prompt, reader in self._LOAN_PROFILE_FIELDS:
+            if not getattr(customer, attr, None):
+                setattr(customer, attr, getattr(self, reader)(prompt))
 
         # Register hard inquiry for this loan application
         add_credit_inquiry(customer)
@@ -1046,7 +1123,7 @@ Loan Menu:
             )
         choice = self.read_valid_choice(
             "Select loan number to pay EMI for: ",
-            [str(i) for i in range(1, len(loans) + 1)],
+            _numeric_choices(len(loans)),
         )
         selected_loan = loans[int(choice) - 1]
         outstanding_emis = max(
@@ -1058,21 +1135,11 @@ Loan Menu:
         if outstanding_emis == 1:
             count = 1
         else:
-            while True:
-                try:
-                    count = int(
-                        input(
-                            f"How many EMIs would you like to pay now? (1-{outstanding_emis}): "
-                        )
-                    )
-                    if 1 <= count <= outstanding_emis:
-                        break
-                    else:
-                        print(
-                            f"Please enter a number between 1 and {outstanding_emis}."
-                        )
-                except ValueError:
-                    print("Please enter a valid number.")
+            count = self.read_int_in_range(
+                f"How many EMIs would you like to pay now? (1-{outstanding_emis}): ",
+                1,
+                outstanding_emis,
+            )
         self.bank.pay_multiple_emis_for_loan(
             selected_loan.loan_id, account.account_number, count
         )
@@ -1128,7 +1195,7 @@ Current Balance: Rs. {account.balance:.2f} INR
         else:
             choice = self.read_valid_choice(
                 f"Select card (1-{len(debit_cards)}): ",
-                [str(i) for i in range(1, len(debit_cards) + 1)],
+                _numeric_choices(len(debit_cards)),
             )
             selected_card = debit_cards[int(choice) - 1]
 
@@ -1167,7 +1234,7 @@ Current Balance: Rs. {account.balance:.2f} INR
         else:
             choice = self.read_valid_choice(
                 f"Select card (1-{len(debit_cards)}): ",
-                [str(i) for i in range(1, len(debit_cards) + 1)],
+                _numeric_choices(len(debit_cards)),
             )
             selected_card = debit_cards[int(choice) - 1]
 
@@ -1218,7 +1285,7 @@ Choose transfer mode:
     def inter_account_transfer(self, account: Account, accounts: List[Account]):
         """Handle inter-account transfer"""
         print("\nYour other accounts:")
-        other_accounts = [acc for acc in accounts if acc != account]
+        other_accounts = [acc for acc in accounts if acc is not account]
 
         for idx, acc in enumerate(other_accounts, 1):
             print(
@@ -1227,7 +1294,7 @@ Choose transfer mode:
 
         choice = self.read_valid_choice(
             f"Select recipient account (1-{len(other_accounts)}): ",
-            [str(i) for i in range(1, len(other_accounts) + 1)],
+            _numeric_choices(len(other_accounts)),
         )
         recipient = other_accounts[int(choice) - 1]
         amount = self.read_positive_double("Enter amount to transfer: Rs. ")
@@ -1242,17 +1309,20 @@ Choose transfer mode:
                 print("Account number cannot be empty. Please try again.")
                 continue
 
+            # The sender's own number needs no lookup
+            if recipient_acc_num == account.account_number:
+                print(
+                    "Cannot transfer to your own account. Please enter a different account number."
+                )
+                continue
+
             recipient = self.bank.find_account_by_number(recipient_acc_num)
-            if recipient and recipient.account_number != account.account_number:
+            if recipient:
                 print(f"Recipient Name: {recipient.first_name} {recipient.last_name}")
                 amount = self.read_positive_double("Enter amount to transfer: Rs. ")
                 account.transfer(recipient, amount, mode)
-                self.bank.save()
+                self.bank.save("accounts")
                 break
-            elif recipient:
-                print(
-                    "Cannot transfer to your own account. Please enter a different account number."
-                )
             else:
                 print(
                     "Recipient account not found. Please check the account number and try again."
@@ -1650,7 +1720,7 @@ Timestamp: {txn.timestamp}{cheque_line}
 
             choice = self.read_valid_choice(
                 f"Enter account number (1-{len(accounts)}): ",
-                [str(i) for i in range(1, len(accounts) + 1)],
+                _numeric_choices(len(accounts)),
             )
             selected = accounts[int(choice) - 1]
             print(
@@ -1675,8 +1745,9 @@ Timestamp: {txn.timestamp}{cheque_line}
 
         account_type = self.read_valid_account_type("Enter account type (1-5): ")
         new_account = self.bank.add_account_to_customer(customer, account_type)
-
-        updated_accounts = self.bank.get_customer_accounts(customer)
+        # The menu's list is already the customer's accounts; extend it
+        # rather than resolving every account number again
+        updated_accounts = accounts + [new_account]
 
         print(f"""
 New Account Created Successfully!
@@ -1695,8 +1766,7 @@ You now have {customer.account_count} account(s) linked to your Customer ID.
 
     def manage_recurring_bills(self, account: Account):
         """Manage recurring bills"""
-        managing = True
-        while managing:
+        while True:
             print("\n=== Recurring Bills Management ===")
             print("1. View Recurring Bills")
             print("2. Add Recurring Bill")
@@ -1715,7 +1785,7 @@ You now have {customer.account_count} account(s) linked to your Customer ID.
             elif choice == "4":
                 self.show_rewards_dashboard(account)  # NEW
             elif choice == "5":
-                managing = False
+                return
 
     def view_recurring_bills(self, account: Account):
         """View recurring bills with payment methods and rewards"""
@@ -1866,11 +1936,11 @@ You now have {customer.account_count} account(s) linked to your Customer ID.
                         rewards_by_card[card_id] += points
 
         # Calculate this month's rewards
-        current_month = BankClock.get_formatted_date()[3:10]  # MM-YYYY
+        current_month = BankClock.today().strftime("%Y-%m")  # YYYY-MM
 
         for txn in account.transactions:
             if txn.type == "CREDIT_CARD_BILL_PAYMENT":
-                txn_month = txn.timestamp[3:10]
+                txn_month = txn.timestamp[:7]
                 if (
                     txn_month == current_month
                     and hasattr(txn, "metadata")
@@ -1911,18 +1981,12 @@ You now have {customer.account_count} account(s) linked to your Customer ID.
     def add_recurring_bill(self, account: Account):
         """Add a recurring bill"""
         print("\n=== Add Recurring Bill ===")
-        print("\nCommon bills:")
+        menu, n_templates = _common_bills_menu()
+        print(menu)
         common_bills = RecurringBillFactory.get_common_bills()
 
-        for idx, (name, cat, min_amt, max_amt, freq) in enumerate(common_bills, 1):
-            print(
-                f"{idx}. {name} ({cat}) - Rs. {min_amt:.2f}-Rs. {max_amt:.2f} [{freq}]"
-            )
-
-        print(f"{len(common_bills) + 1}. Custom Bill")
-
         template_choice = self.read_valid_choice(
-            "Select bill template: ", [str(i) for i in range(1, len(common_bills) + 2)]
+            "Select bill template: ", _numeric_choices(n_templates + 1)
         )
 
         # Handle Credit Card Bill (option 17)
@@ -1946,12 +2010,12 @@ You now have {customer.account_count} account(s) linked to your Customer ID.
             freq_choice = self.read_valid_choice("Select: ", ["1", "2", "3"])
             frequency = {"1": "MONTHLY", "2": "QUARTERLY", "3": "YEARLY"}[freq_choice]
 
-        day_of_month = int(input("Due day of month (1-28): "))
+        day_of_month = self.read_int_in_range("Due day of month (1-28): ", 1, 28)
 
         # ===== PAYMENT METHOD SELECTION =====
-        print("\n" + "=" * 60)
+        print("\n" + _EQ60)
         print("💳 PAYMENT METHOD")
-        print("=" * 60)
+        print(_EQ60)
         print("How would you like to pay this bill?")
         print("1. Bank Account (Direct Debit)")
         print("2. Credit Card (Earn Reward Points 💎)")
@@ -2030,16 +2094,16 @@ You now have {customer.account_count} account(s) linked to your Customer ID.
         account.add_recurring_bill(bill)
         self.bank.save()
 
-        print("\n" + "=" * 60)
+        print("\n" + _EQ60)
         print("✅ RECURRING BILL ADDED")
-        print("=" * 60)
+        print(_EQ60)
         print(f"Bill Name: {bill.name}")
         print(f"Amount: Rs. {bill.base_amount:,.2f}")
         print(f"Frequency: {bill.frequency}")
         print(f"Due Day: {bill.day_of_month}")
         print(f"Payment Method: {bill.get_payment_description(account)}")
         print(f"Auto-pay: {'✅ Enabled' if bill.auto_debit else '❌ Disabled'}")
-        print("=" * 60)
+        print(_EQ60)
 
         input("\nPress Enter to continue...")
 
@@ -2053,9 +2117,9 @@ You now have {customer.account_count} account(s) linked to your Customer ID.
             input("\nPress Enter to continue...")
             return
 
-        print("\n" + "=" * 60)
+        print("\n" + _EQ60)
         print("CREDIT CARD BILL SETUP")
-        print("=" * 60)
+        print(_EQ60)
         print("0. Manual Entry (Custom Amount)")
 
         for idx, card in enumerate(credit_cards, 1):
@@ -2095,7 +2159,7 @@ You now have {customer.account_count} account(s) linked to your Customer ID.
 
         category = "Finance"
         frequency = "MONTHLY"
-        day_of_month = int(input("Due day of month (1-28): "))
+        day_of_month = self.read_int_in_range("Due day of month (1-28): ", 1, 28)
 
         # Credit card bills are ALWAYS paid from bank account
         payment_method = PaymentMethod.BANK_ACCOUNT
@@ -2123,16 +2187,16 @@ You now have {customer.account_count} account(s) linked to your Customer ID.
         account.add_recurring_bill(bill)
         self.bank.save()
 
-        print("\n" + "=" * 60)
+        print("\n" + _EQ60)
         print("✅ CREDIT CARD BILL ADDED")
-        print("=" * 60)
+        print(_EQ60)
         print(f"Bill: {bill.name}")
         print(f"Amount: Rs. {bill.base_amount:,.2f}")
         print(f"Due Day: {bill.day_of_month}")
         print(f"Auto-pay: {'✅ Enabled' if bill.auto_debit else '❌ Disabled'}")
         if is_dynamic:
             print("📊 Amount will auto-update from card")
-        print("=" * 60)
+        print(_EQ60)
 
         input("\nPress Enter to continue...")
 
@@ -2189,8 +2253,7 @@ You now have {customer.account_count} account(s) linked to your Customer ID.
 
     def manage_salary(self, account: Account):
         """Manage salary profile"""
-        managing = True
-        while managing:
+        while True:
             print("""
 Salary Management
 1  View Salary Details
@@ -2208,14 +2271,16 @@ Salary Management
                 gross_salary = self.read_positive_double(
                     "Enter gross monthly salary: Rs. "
                 )
-                salary_day = int(input("Enter salary credit day (1-28): "))
+                salary_day = self.read_int_in_range(
+                    "Enter salary credit day (1-28): ", 1, 28
+                )
                 account.set_salary(gross_salary, salary_day)
                 self.bank.save()
             elif choice == "3":
                 account.remove_salary()
                 self.bank.save()
             elif choice == "4":
-                managing = False
+                return
 
     def simulate_time(self, account: Account):
         """Simulate time passage with recurring bills and expenses"""
@@ -2230,44 +2295,65 @@ Salary Management
         sim_choice = self.read_valid_choice("Enter choice: ", ["1", "2", "3", "4", "5"])
 
         days_map = {"1": 1, "2": 7, "3": 30, "4": 90}
-        days = days_map.get(sim_choice, int(input("Enter number of days: ")))
+        if sim_choice in days_map:
+            days = days_map[sim_choice]
+        else:
+            days = int(input("Enter number of days: "))
 
         print(f"\nSimulating {days} day(s)...")
         print(f"Starting Date/Time: {BankClock.get_formatted_datetime()}")
-        print("=" * 60)
+        print(_EQ60)
 
         total_transactions = 0
         start_balance = account.balance
 
-        for day in range(1, days + 1):
-            BankClock.advance_day()
-            current_date = BankClock.today()
-
-            # Process daily tasks across the whole bank (recurring bills, salary credits, card bills)
-            bills_processed = self.bank.process_daily_tasks()
-
-            # Still simulate daily expenses for the focused account for reporting
-            daily_txns = ExpenseSimulator.simulate_day(account, self.bank, current_date)
-
-            total_transactions += bills_processed + daily_txns
+        # Loop-invariant lookups bound once; progress is reported weekly
+        # and on the final day
+        bank = self.bank
+        advance_day = BankClock.advance_day
+        today = BankClock.today
+        process_daily_tasks = bank.process_daily_tasks
+        simulate_day = ExpenseSimulator.simulate_day
+        report_days = frozenset(range(7, days, 7)) | {days}
+        progress = []
+
+        # Daily saves are deferred and the bank is written once when the block exits
+        with bank.batch():
+            for day in range(1, days + 1):
+                advance_day()
+                current_date = today()
+
+                # Process daily tasks across the whole bank (recurring bills, salary credits, card bills)
+                bills_processed = process_daily_tasks()
+
+                # Still simulate daily expenses for the focused account for reporting
+                daily_txns = simulate_day(account, bank, current_date)
+
+                day_txns = bills_processed + daily_txns
+                total_transactions += day_txns
+
+                if day in report_days:
+                    progress.append(
+                        f"Day {day:3d} [{BankClock.get_formatted_date()}]: Balance = Rs. {account.balance:,.2f} INR | Txns = {day_txns}"
+                    )
 
-            if day % 7 == 0 or day == days:
-                print(
-                    f"Day {day:3d} [{BankClock.get_formatted_date()}]: Balance = Rs. {account.balance:,.2f} INR | Txns = {bills_processed + daily_txns}"
-                )
+            bank.save()
 
-        self.bank.save()
         balance_change = account.balance - start_balance
         change_symbol = "+" if balance_change >= 0 else ""
 
-        print("=" * 60)
-        print("Simulation complete!")
-        print(f"Ending Date/Time: {BankClock.get_formatted_datetime()}")
-        print(f"Total Transactions: {total_transactions}")
-        print(f"Starting Balance: Rs. {start_balance:,.2f} INR")
-        print(f"Ending Balance: Rs. {account.balance:,.2f} INR")
-        print(f"Net Change: {change_symbol}Rs. {balance_change:,.2f} INR")
-        print("=" * 60)
+        # Weekly progress and the summary go out in one write
+        progress += [
+            _EQ60,
+            "Simulation complete!",
+            f"Ending Date/Time: {BankClock.get_formatted_datetime()}",
+            f"Total Transactions: {total_transactions}",
+            f"Starting Balance: Rs. {start_balance:,.2f} INR",
+            f"Ending Balance: Rs. {account.balance:,.2f} INR",
+            f"Net Change: {change_symbol}Rs. {balance_change:,.2f} INR",
+            _EQ60,
+        ]
+        sys.stdout.write("\n".join(progress) + "\n")
 
     def view_expense_analysis(self, account: Account):
         """View expense analysis for a period"""
@@ -2322,9 +2408,12 @@ Choose an option:
 
     def view_cibil_report(self, customer: Customer):
         """View detailed CIBIL score report with history"""
-        print("\n" + "=" * 70)
-        print("                    CIBIL SCORE REPORT")
-        print("=" * 70)
+        # The report is collected here and written in one go at the end
+        lines = []
+        out = lines.append
+        out("\n" + "=" * 70)
+        out("                    CIBIL SCORE REPORT")
+        out("=" * 70)
 
         # Calculate current score
         current_score = calculate_cibil_score(customer, self.bank)
@@ -2344,44 +2433,48 @@ Choose an option:
             rating = "Poor ⭐⭐"
             color = "🔴"
 
-        print(f"\n{color} CIBIL Score: {current_score}/900")
-        print(f"Rating: {rating}")
-        print(f"Customer: {customer.first_name} {customer.last_name}")
-        print(f"Customer ID: {customer.customer_id}")
-        print(f"Report Generated: {BankClock.get_formatted_datetime()}")
+        out(f"\n{color} CIBIL Score: {current_score}/900")
+        out(f"Rating: {rating}")
+        out(f"Customer: {customer.first_name} {customer.last_name}")
+        out(f"Customer ID: {customer.customer_id}")
+        out(f"Report Generated: {BankClock.get_formatted_datetime()}")
 
-        print("\n" + "-" * 70)
-        print("SCORE BREAKDOWN")
-        print("-" * 70)
+        out("\n" + "-" * 70)
+        out("SCORE BREAKDOWN")
+        out("-" * 70)
 
         # Get loans for analysis
         loans = self.bank.get_loans_for_customer(customer.customer_id)
         today = BankClock.today()
 
         # 1. Repayment History Analysis
-        print("\n📊 REPAYMENT HISTORY")
+        out("\n📊 REPAYMENT HISTORY")
         total_emis = 0
         late_payments = 0
         on_time_payments = 0
 
+        # EMIs due so far per loan, reused by the detailed history below
+        expected_by_loan = []
+        today_month = today.year * 12 + today.month
+
         if loans:
             for loan in loans:
                 emis_paid = getattr(loan, "emis_paid", 0)
-                total_emis += loan.tenure_months
+                tenure = loan.tenure_months
+                total_emis += tenure
 
                 # Calculate expected EMIs based on loan start date
                 if hasattr(loan, "start_date"):
-                    months_elapsed = (today.year - loan.start_date.year) * 12 + (
-                        today.month - loan.start_date.month
-                    )
-                    expected_emis = min(months_elapsed + 1, loan.tenure_months)
+                    start = loan.start_date
+                    months_elapsed = today_month - (start.year * 12 + start.month)
+                    expected_emis = min(months_elapsed + 1, tenure)
                 else:
-                    expected_emis = loan.tenure_months
+                    expected_emis = tenure
+                expected_by_loan.append(expected_emis)
 
-                missed = max(0, expected_emis - emis_paid)
-                on_time = emis_paid
-                late_payments += missed
-                on_time_payments += on_time
+                if expected_emis > emis_paid:
+                    late_payments += expected_emis - emis_paid
+                on_time_payments += emis_paid
 
             if late_payments == 0:
                 impact = "Excellent (+100 points)"
@@ -2391,16 +2484,16 @@ Choose an option:
                 impact = f"Poor (-{penalty} points)"
                 status = f"❌ {late_payments} late payment(s)"
 
-            print(f"  Status: {status}")
-            print(f"  Total EMIs Paid: {on_time_payments}")
-            print(f"  Late/Missed EMIs: {late_payments}")
-            print(f"  Impact on Score: {impact}")
+            out(f"  Status: {status}")
+            out(f"  Total EMIs Paid: {on_time_payments}")
+            out(f"  Late/Missed EMIs: {late_payments}")
+            out(f"  Impact on Score: {impact}")
         else:
-            print("  Status: No loan history")
-            print("  Impact: Neutral (Base score)")
+            out("  Status: No loan history")
+            out("  Impact: Neutral (Base score)")
 
         # 2. Credit Utilization
-        print("\n💳 CREDIT UTILIZATION")
+        out("\n💳 CREDIT UTILIZATION")
         # Get credit cards from customer's accounts
         credit_cards = []
         customer_accounts = self.bank.get_customer_accounts(customer)
@@ -2427,16 +2520,16 @@ Choose an option:
             else:
                 impact = "Moderate (0 points)"
 
-            print(f"  Total Credit Limit: ₹{total_limit:,.2f}")
-            print(f"  Total Used: ₹{total_used:,.2f}")
-            print(f"  Utilization: {utilization:.1f}%")
-            print(f"  Impact: {impact}")
+            out(f"  Total Credit Limit: ₹{total_limit:,.2f}")
+            out(f"  Total Used: ₹{total_used:,.2f}")
+            out(f"  Utilization: {utilization:.1f}%")
+            out(f"  Impact: {impact}")
         else:
-            print("  Status: No credit cards")
-            print("  Impact: Neutral")
+            out("  Status: No credit cards")
+            out("  Impact: Neutral")
 
         # 3. Credit Accounts
-        print("\n📋 CREDIT ACCOUNTS")
+        out("\n📋 CREDIT ACCOUNTS")
         n_loans = len(loans)
         n_cards = len(credit_cards)  # Use the credit_cards list from above
         total_accounts = n_loans + n_cards
@@ -2448,16 +2541,27 @@ Choose an option:
         else:
             impact = "Neutral"
 
-        print(f"  Active Loans: {n_loans}")
-        print(f"  Credit Cards: {n_cards}")
-        print(f"  Total Accounts: {total_accounts}")
-        print(f"  Impact: {impact}")
+        out(f"  Active Loans: {n_loans}")
+        out(f"  Credit Cards: {n_cards}")
+        out(f"  Total Accounts: {total_accounts}")
+        out(f"  Impact: {impact}")
 
         # 4. Recent Hard Inquiries
-        print("\n🔍 CREDIT INQUIRIES (Last 12 Months)")
+        out("\n🔍 CREDIT INQUIRIES (Last 12 Months)")
         hard_inquiries = getattr(customer, "recent_hard_inquiries", [])
-        recent_inquiries = [d for d in hard_inquiries if (today - d).days <= 365]
-        n_recent = len(recent_inquiries)
+        # Inquiries are recorded oldest first, so walk back from the newest
+        # and stop at the first one outside the 12-month window; keep the
+        # latest five as (date, days ago) for the listing
+        latest_inquiries = []
+        n_recent = 0
+        for inquiry_date in reversed(hard_inquiries):
+            days_ago = (today - inquiry_date).days
+            if days_ago > 365:
+                break
+            n_recent += 1
+            if n_recent <= 5:
+                latest_inquiries.append((inquiry_date, days_ago))
+        latest_inquiries.reverse()
 
         if n_recent > 3:
             impact = "Too many inquiries (-30 points)"
@@ -2466,15 +2570,13 @@ Choose an option:
         else:
             impact = "No recent inquiries"
 
-        print(f"  Recent Inquiries: {n_recent}")
-        if recent_inquiries:
-            for idx, inquiry_date in enumerate(recent_inquiries[-5:], 1):
-                days_ago = (today - inquiry_date).days
-                print(f"    {idx}. {days_ago} days ago ({inquiry_date})")
-        print(f"  Impact: {impact}")
+        out(f"  Recent Inquiries: {n_recent}")
+        for idx, (inquiry_date, days_ago) in enumerate(latest_inquiries, 1):
+            out(f"    {idx}. {days_ago} days ago ({inquiry_date})")
+        out(f"  Impact: {impact}")
 
         # 5. Credit Mix
-        print("\n🎯 CREDIT MIX")
+        out("\n🎯 CREDIT MIX")
         account_types = set()
         for loan in loans:
             account_types.add("Loan")
@@ -2486,29 +2588,25 @@ Choose an option:
         else:
             impact = "Limited variety"
 
-        print(
+        out(
             f"  Account Types: {', '.join(account_types) if account_types else 'None'}"
         )
-        print(f"  Impact: {impact}")
+        out(f"  Impact: {impact}")
 
         # 6. Credit History Age
-        print("\n📅 CREDIT HISTORY AGE")
+        out("\n📅 CREDIT HISTORY AGE")
         account_dates = []
         for loan in loans:
             if hasattr(loan, "start_date"):
                 account_dates.append(loan.start_date)
-        # Add credit card dates
-        for acc in customer_accounts:
-            for card in acc.cards:
-                if isinstance(card, CreditCard):
-                    # Cards don't have start_date, so use today as approximation
-                    # or you can add a created_date attribute to cards
-                    account_dates.append(BankClock.today())
+        # Add credit card dates; cards don't have start_date, so use today
+        # as approximation (one entry per card counted above)
+        account_dates.extend([today] * n_cards)
 
         if account_dates:
             oldest = min(account_dates)
-            age_years = (today - oldest).days // 365
-            age_months = ((today - oldest).days % 365) // 30
+            age_years, age_days = divmod((today - oldest).days, 365)
+            age_months = age_days // 30
 
             if age_years >= 3:
                 impact = "Excellent (+20 points)"
@@ -2517,60 +2615,52 @@ Choose an option:
             else:
                 impact = "New credit history"
 
-            print(f"  Oldest Account: {age_years} years, {age_months} months")
-            print(f"  Opened On: {oldest}")
-            print(f"  Impact: {impact}")
+            out(f"  Oldest Account: {age_years} years, {age_months} months")
+            out(f"  Opened On: {oldest}")
+            out(f"  Impact: {impact}")
         else:
-            print("  Status: No credit history")
-            print("  Impact: New to credit")
+            out("  Status: No credit history")
+            out("  Impact: New to credit")
 
         # Loan History Details
         if loans:
-            print("\n" + "-" * 70)
-            print("DETAILED LOAN HISTORY")
-            print("-" * 70)
-            for idx, loan in enumerate(loans, 1):
+            out("\n" + "-" * 70)
+            out("DETAILED LOAN HISTORY")
+            out("-" * 70)
+            for idx, (loan, expected_emis) in enumerate(
+                zip(loans, expected_by_loan), 1
+            ):
                 emis_paid = getattr(loan, "emis_paid", 0)
                 total_emi = loan.tenure_months
                 outstanding = total_emi - emis_paid
-                print(f"\n{idx}. Loan ID: {loan.loan_id}")
-                print(f"   Principal: ₹{loan.principal:,.2f}")
-                print(f"   Interest Rate: {loan.interest_rate}% p.a.")
-                print(f"   Tenure: {loan.tenure_months} months")
-                print(f"   EMI Amount: ₹{loan.calculate_emi():,.2f}")
+                out(f"\n{idx}. Loan ID: {loan.loan_id}")
+                out(f"   Principal: ₹{loan.principal:,.2f}")
+                out(f"   Interest Rate: {loan.interest_rate}% p.a.")
+                out(f"   Tenure: {loan.tenure_months} months")
+                out(f"   EMI Amount: ₹{loan.calculate_emi():,.2f}")
                 if hasattr(loan, "start_date"):
-                    print(f"   Activation Date: {loan.start_date}")
-                print(f"   Status: {loan.status}")
-                print(f"   EMIs Paid: {emis_paid}/{total_emi}")
+                    out(f"   Activation Date: {loan.start_date}")
+                out(f"   Status: {loan.status}")
+                out(f"   EMIs Paid: {emis_paid}/{total_emi}")
                 if loan.status == "Closed" or emis_paid >= total_emi:
                     if hasattr(loan, "closure_date"):
-                        print(f"   ✅ Loan Closed On: {loan.closure_date}")
+                        out(f"   ✅ Loan Closed On: {loan.closure_date}")
                     else:
-                        print("   ✅ All EMIs Paid - Loan Fully Repaid")
+                        out("   ✅ All EMIs Paid - Loan Fully Repaid")
                 elif outstanding > 0:
-                    print(f"   Outstanding EMIs: {outstanding}")
+                    out(f"   Outstanding EMIs: {outstanding}")
                     if hasattr(loan, "start_date"):
-                        months_elapsed = (today.year - loan.start_date.year) * 12 + (
-                            today.month - loan.start_date.month
-                        )
-                        expected_emis = min(months_elapsed + 1, loan.tenure_months)
                         if emis_paid < expected_emis:
                             missed = expected_emis - emis_paid
-                            print(f"   ⚠️  Overdue EMIs: {missed}")
+                            out(f"   ⚠️  Overdue EMIs: {missed}")
 
         # Score Range Guide
-        print("\n" + "-" * 70)
-        print("SCORE RANGE GUIDE")
-        print("-" * 70)
-        print("  300-549: Poor       - High risk, loans often denied")
-        print("  550-649: Average    - Moderate risk, limited options")
-        print("  650-749: Good       - Low risk, favorable terms")
-        print("  750-900: Excellent  - Best rates and quick approvals")
+        out(self._CIBIL_RANGE_GUIDE)
 
         # Recommendations
-        print("\n" + "-" * 70)
-        print("RECOMMENDATIONS TO IMPROVE YOUR SCORE")
-        print("-" * 70)
+        out("\n" + "-" * 70)
+        out("RECOMMENDATIONS TO IMPROVE YOUR SCORE")
+        out("-" * 70)
         recommendations = []
 
         if late_payments > 0:
@@ -2588,12 +2678,13 @@ Choose an option:
             recommendations.append("✓ Continue making timely payments")
 
         for rec in recommendations:
-            print(f"  {rec}")
+            out(f"  {rec}")
 
-        print("\n" + "=" * 70)
+        out("\n" + "=" * 70)
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        # Save updated score
-        self.bank.save()
+        # Save updated score; only the customer record changed
+        self.bank.save("customers")
 
     def generate_loan_closure_certificate(self, customer: Customer, account: Account):
         """Generate loan closure certificate for closed loans"""
@@ -2617,7 +2708,7 @@ Choose an option:
 
         choice = self.read_valid_choice(
             f"\nSelect loan number (1-{len(closed_loans)}): ",
-            [str(i) for i in range(1, len(closed_loans) + 1)],
+            _numeric_choices(len(closed_loans)),
         )
 
         selected_loan = closed_loans[int(choice) - 1]
@@ -2831,9 +2922,9 @@ Choose an option:
             print("Card not found")
             return
 
-        print("\n" + "=" * 60)
+        print("\n" + _EQ60)
         print("CARD DETAILS")
-        print("=" * 60)
+        print(_EQ60)
         print(f"Card Type: {card.card_type}")
         print(f"Card Network: {card.network}")
         print(f"Card Number: **** **** **** {card.card_number[-4:]}")
@@ -2864,14 +2955,12 @@ Choose an option:
                 print(f"Outstanding Balance: Rs. {card.outstanding_balance:,.2f} INR")
                 print(f"Minimum Due: Rs. {card.minimum_due:,.2f} INR")
                 if card.due_date:
-                    from BankClock import BankClock
-
                     days_remaining = (card.due_date - BankClock.today()).days
                     print(
                         f"Due Date: {card.due_date.strftime('%d-%m-%Y')} ({days_remaining} days)"
                     )
 
-        print("=" * 60)
+        print(_EQ60)
 
         # Card validation
         is_valid = Card.validate_card_number(card.card_number)
@@ -2880,15 +2969,15 @@ Choose an option:
             f"\n✓ Card Number Validation: {'Valid' if is_valid else 'Invalid'} (Luhn Check)"
         )
         print(f"✓ Detected Network from Number: {detected_network}")
-        print("=" * 60)
+        print(_EQ60)
 
     def view_transaction_history_menu(self, account: Account):
         """Interactive menu for viewing transaction history"""
 
         while True:
-            print("\n" + "=" * 60)
+            print("\n" + _EQ60)
             print("TRANSACTION HISTORY")
-            print("=" * 60)
+            print(_EQ60)
 
             # Quick View Options
             print("\n📊 QUICK VIEW:")
@@ -2911,7 +3000,7 @@ Choose an option:
             print("14. Expenses")
 
             print("\n15. Back to Account Menu")
-            print("=" * 60)
+            print(_EQ60)
 
             choice = input("Enter your choice: ").strip()
 
@@ -2950,8 +3039,6 @@ Choose an option:
 
     def view_debit_card_transactions(self, account: Account):
         """View transactions by specific debit card"""
-        from Card import DebitCard
-
         debit_cards = [c for c in account.cards if isinstance(c, DebitCard)]
 
         if not debit_cards:
@@ -17,8 +17,13 @@ def calculate_cibil_score(customer, bank):
     total_emis = 0
     missed_this_year = 0
     active_deliquency = 0
+    # Credit mix and account ages are collected in the same pass over loans
+    account_types = set()
+    account_dates = []
 
     for loan in loans:
+        account_types.add(getattr(loan, "type", "term_loan"))
+        account_dates.append(getattr(loan, "start_date", today))
         emis_paid = getattr(loan, "emis_paid", 0)
         n = loan.tenure_months
         total_emis += n
@@ -45,10 +50,11 @@ def calculate_cibil_score(customer, bank):
     # --- Credit utilization ---
     total_limit = 0
     total_used = 0
-    if hasattr(customer, "credit_cards"):  # Suppose you add credit_cards info: [{limit, used},...]
-        for cc in customer.credit_cards:
-            total_limit += cc.get("limit", 0)
-            total_used += cc.get("used", 0)
+    credit_cards = getattr(customer, "credit_cards", [])  # [{limit, used, opened},...]
+    for cc in credit_cards:
+        total_limit += cc.get("limit", 0)
+        total_used += cc.get("used", 0)
+        account_dates.append(cc.get("opened", today))
     utilization = (total_used / total_limit * 100) if total_limit else 0
     if total_limit > 0:
         if utilization < 30:
@@ -57,7 +63,7 @@ def calculate_cibil_score(customer, bank):
             score -= 50
 
     # --- Number of credit accounts ---
-    n_cards = len(getattr(customer, "credit_cards", []))
+    n_cards = len(credit_cards)
     n_loans = len(loans)
     total_accounts = n_cards + n_loans
     if total_accounts > 7:
@@ -72,20 +78,12 @@ def calculate_cibil_score(customer, bank):
         score -= 30
 
     # --- Credit mix/type ---
-    account_types = set()
-    for loan in loans:
-        account_types.add(getattr(loan, "type", "term_loan"))
     if n_cards > 0:
         account_types.add("credit_card")
     if len(account_types) > 1:
         score += 30
 
     # --- Oldest account ---
-    account_dates = []
-    for loan in loans:
-        account_dates.append(getattr(loan, "start_date", today))
-    for cc in getattr(customer, "credit_cards", []):
-        account_dates.append(cc.get("opened", today))
     if account_dates:
         oldest = min(account_dates)
         years = (today - oldest).days // 365
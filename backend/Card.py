@@ -35,6 +35,7 @@ class Card:
     ):
         self.card_id = card_id or self.generate_card_id()
         self.card_number = card_number
+        self.last4 = card_number[-4:]  # Cached for masking and activity logs
         self.customer_id = customer_id
         self.account_number = account_number
         self.card_type = card_type  # "DEBIT" or "CREDIT"
@@ -80,7 +81,7 @@ class Card:
 
     def get_masked_number(self) -> str:
         """Get masked card number (e.g., **** **** **** 1234)"""
-        return "**** **** **** " + self.card_number[-4:]
+        return "**** **** **** " + self.last4
 
     @staticmethod
     def generate_card_number(card_type: str = "DEBIT", network: str = "VISA") -> str:
@@ -310,7 +311,7 @@ class DebitCard(Card):
             return False, msg, None
 
         # Check account balance
-        min_balance = account._min_operational_balance
+        min_balance = account._MIN_OPERATIONAL_BALANCE
         if account.balance - amount < min_balance:
             return (
                 False,
@@ -321,8 +322,8 @@ class DebitCard(Card):
         # Check daily limits for minor accounts
         if account.is_minor_account:
             today_transactions = account.get_today_transactions()
-            if today_transactions + amount > account._minor_daily_transaction_limit:
-                remaining = account._minor_daily_transaction_limit - today_transactions
+            if today_transactions + amount > account._MINOR_DAILY_TRANSACTION_LIMIT:
+                remaining = account._MINOR_DAILY_TRANSACTION_LIMIT - today_transactions
                 return (
                     False,
                     f"Daily transaction limit exceeded. Remaining: Rs. {remaining:.2f} INR",
@@ -388,7 +389,7 @@ class DebitCard(Card):
             )
 
         # Check account balance
-        min_balance = account._min_operational_balance
+        min_balance = account._MIN_OPERATIONAL_BALANCE
         if account.balance - amount < min_balance:
             return (
                 False,
@@ -591,7 +592,7 @@ class CreditCard(Card):
             )
 
         # Check if account has sufficient balance
-        min_balance = account._min_operational_balance
+        min_balance = account._MIN_OPERATIONAL_BALANCE
         if account.balance - amount < min_balance:
             return (
                 False,
@@ -733,7 +734,7 @@ class CreditCard(Card):
 
         # Check account balance for cash portion
         if cash_amount > 0:
-            min_balance = account._min_operational_balance
+            min_balance = account._MIN_OPERATIONAL_BALANCE
             if account.balance - cash_amount < min_balance:
                 return (
                     False,
@@ -973,7 +974,7 @@ class CreditCard(Card):
         # Include transactions for persistence
         try:
             base_dict["transactions"] = [
-                t.to_dict() for t in getattr(self, "transactions", [])
+                t._to_dict_cached() for t in getattr(self, "transactions", [])
             ]
         except Exception:
             base_dict["transactions"] = []
@@ -119,8 +119,8 @@ class ClosureFormalities:
         # Check for active loans
         active_loans = [
             loan
-            for loan in bank.loans
-            if loan.customer_id == account.customer_id and not loan.status == "Closed"
+            for loan in bank.iter_loans_for_customer(account.customer_id)
+            if not loan.status == "Closed"
         ]
 
         if active_loans:
@@ -168,9 +168,9 @@ class ClosureFormalities:
         else:
             print("✅ No credit card outstanding balances")
 
-        if account.balance < account._min_operational_balance:
+        if account.balance < account._MIN_OPERATIONAL_BALANCE:
             issues.append(
-                f"❌ Account balance (Rs. {account.balance:.2f} INR) below minimum (Rs. {account._min_operational_balance:.2f} INR)"
+                f"❌ Account balance (Rs. {account.balance:.2f} INR) below minimum (Rs. {account._MIN_OPERATIONAL_BALANCE:.2f} INR)"
             )
         else:
             print("✅ Sufficient balance for closure")
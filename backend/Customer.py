@@ -14,6 +14,36 @@ class Customer:
     _used_customer_ids = set()
     _used_ids_file = "data/customer_ids.txt"
 
+    # Fixed attribute layout; recent_hard_inquiries is set lazily by CIBIL
+    __slots__ = (
+        "customer_id",
+        "username",
+        "password",
+        "first_name",
+        "last_name",
+        "dob",
+        "gender",
+        "phone_number",
+        "email",
+        "_account_numbers",
+        "_account_number_set",
+        "failed_attempts",
+        "locked",
+        "cibil_score",
+        "salary",
+        "employer_name",
+        "employer_type",
+        "job_start_date",
+        "employer_category",
+        "city",
+        "kyc_completed",
+        "has_salary_account",
+        "credit_cards",
+        "recent_hard_inquiries",
+        "_dob_cache",
+        "_job_start_cache",
+    )
+
     def __init__(
         self,
         customer_id: str,
@@ -51,6 +81,8 @@ class Customer:
         self.phone_number = phone_number
         self.email = email
         self._account_numbers = account_numbers if account_numbers is not None else []
+        # Same numbers as a set, for owns_account and the add/remove checks
+        self._account_number_set = set(self._account_numbers)
         self.failed_attempts = failed_attempts
         self.locked = locked
 
@@ -67,14 +99,17 @@ class Customer:
         # New fields
         self.has_salary_account = has_salary_account
         self.credit_cards = credit_cards if credit_cards is not None else []
+        self._dob_cache = None  # (dob, parsed date) of the last parse
+        self._job_start_cache = None  # same, for job_start_date
 
     def get_account_numbers(self) -> List[str]:
         return self._account_numbers.copy()
 
     def add_account(self, account_number: str):
-        if account_number not in self._account_numbers:
+        if account_number not in self._account_number_set:
             self._account_numbers.append(account_number)
-            ts = BankClock.get_formatted_datetime()
+            self._account_number_set.add(account_number)
+            ts = BankClock.get_iso_datetime()
             DataStore.append_activity(
                 timestamp=ts,
                 username=self.username,
@@ -86,9 +121,11 @@ class Customer:
             )
 
     def remove_account(self, account_number: str):
-        if account_number in self._account_numbers:
+        if account_number in self._account_number_set:
             self._account_numbers.remove(account_number)
-            ts = BankClock.get_formatted_datetime()
+            if account_number not in self._account_numbers:  # loaded duplicates
+                self._account_number_set.discard(account_number)
+            ts = BankClock.get_iso_datetime()
             DataStore.append_activity(
                 timestamp=ts,
                 username=self.username,
@@ -104,12 +141,38 @@ class Customer:
         return len(self._account_numbers)
 
     def owns_account(self, account_number: str) -> bool:
-        return account_number in self._account_numbers
+        return account_number in self._account_number_set
+
+    @property
+    def dob_date(self) -> date:
+        """Date of birth as a date, parsed once per dob value"""
+        cache = self._dob_cache
+        if cache is None or cache[0] != self.dob:
+            dob = self.dob
+            cache = (dob, date.fromisoformat(dob) if isinstance(dob, str) else dob)
+            self._dob_cache = cache
+        return cache[1]
+
+    @property
+    def job_start(self) -> Optional[date]:
+        """
+        Job start date as a date, parsed once per job_start_date value
+
+        Raises:
+            ValueError: If job_start_date is set but not a valid ISO date
+        """
+        cache = self._job_start_cache
+        if cache is None or cache[0] != self.job_start_date:
+            started = self.job_start_date
+            parsed = (
+                date.fromisoformat(started) if isinstance(started, str) else started
+            )
+            cache = (started, parsed)
+            self._job_start_cache = cache
+        return cache[1]
 
     def calculate_age(self) -> int:
-        dob_date = (
-            date.fromisoformat(self.dob) if isinstance(self.dob, str) else self.dob
-        )
+        dob_date = self.dob_date
         today = date.today()
         return (
             today.year
@@ -124,7 +187,7 @@ class Customer:
         """
         emis = sum(
             loan.calculate_emi()
-            for loan in bank.get_loans_for_customer(self.customer_id)
+            for loan in bank.iter_loans_for_customer(self.customer_id)
             if getattr(loan, "status", "Active") == "Active"
         )
         return emis / self.salary if self.salary and self.salary > 0 else 0.0
@@ -182,7 +245,7 @@ class Customer:
             failed_attempts=0,
             locked=False,
         )
-        ts = BankClock.get_formatted_datetime()
+        ts = BankClock.get_iso_datetime()
         DataStore.append_activity(
             timestamp=ts,
             username=username,
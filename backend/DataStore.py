@@ -2,8 +2,11 @@ import csv
 import json
 import os
 import shutil
+from contextlib import contextmanager
 from threading import Lock
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
+
+from BankClock import BankClock
 
 
 class DataStore:
@@ -14,15 +17,57 @@ class DataStore:
     ACTIVITY_PATH = "data/account_activity.csv"
     CUSTOMER_JSON_PATH = "data/customers.json"
     LOANS_JSON_PATH = "data/loans.json"  # <-- Loan path added
+    # The registry lives next to this module (backend/data/), not under the cwd
+    INTERNATIONAL_JSON_PATH = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "data",
+        "international_accounts.json",
+    )
 
     _lock = Lock()
+    _ensured_dirs = set()  # Directories already created/verified this run
+
+    # Activity rows buffered while a batch() block is open
+    _activity_buffer: Optional[List[list]] = None
+    _batch_depth = 0
+
+    # Transfers are logged as one paired row; the recipient half is carried
+    # in these metadata keys and split back out on replay
+    _TRANSFER_SUFFIX = "_TRANSFER"
+    _RECIPIENT_KEYS = (
+        "recipientUsername",
+        "recipientAccount",
+        "recipientBalance",
+        "recipientTxnId",
+    )
+
+    # Activity actions that are rebuilt into transactions on replay
+    _REPLAY_ACTIONS = frozenset(
+        (
+            "DEPOSIT",
+            "WITHDRAW",
+            "NEFT_SENT",
+            "NEFT_RECEIVED",
+            "RTGS_SENT",
+            "RTGS_RECEIVED",
+            "INTER_ACCOUNT_SENT",
+            "INTER_ACCOUNT_RECEIVED",
+            "AMB_FEE",
+            "AMB_FEE_SETTLED",
+            "BILL_PAYMENT",
+            "EXPENSE",
+            "SALARY_CREDIT",
+        )
+    )
 
     @staticmethod
     def _ensure_dir(filepath: str):
-        """Ensure parent directory exists for a file"""
+        """Ensure parent directory exists for a file (checked once per directory)"""
         directory = os.path.dirname(filepath)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
+        if not directory or directory in DataStore._ensured_dirs:
+            return
+        os.makedirs(directory, exist_ok=True)
+        DataStore._ensured_dirs.add(directory)
 
     @staticmethod
     def _atomic_replace(tmp_file: str, dest_file: str, label: str):
@@ -41,6 +86,16 @@ class DataStore:
             except Exception as ex:
                 print(f"[DataStore] Copy fallback also failed for {label}: {ex}")
 
+    @staticmethod
+    def _dump_json(data, f):
+        """
+        Serialize data as compact JSON and write it in one call
+
+        Without indent, json uses its C encoder, and encoding to a single
+        string avoids the many small writes json.dump makes.
+        """
+        f.write(json.dumps(data, separators=(",", ":")))
+
     @staticmethod
     def _ensure_activity_header():
         """Ensure activity log file exists with header"""
@@ -74,13 +129,14 @@ class DataStore:
         resulting_balance: Optional[float] = None,
         txn_id: Optional[str] = None,
         cheque_id: Optional[str] = None,
-        metadata: Optional[str] = None,
+        metadata: Optional[Union[str, Dict[str, object]]] = None,
     ):
         """
         Append an activity record to the activity log
 
         Args:
-            timestamp: Timestamp of the activity
+            timestamp: Timestamp of the activity; legacy dd-mm-yyyy values
+                are written in ISO-8601 like transaction rows
             username: Username associated with the activity
             account_number: Account number
             action: Action performed
@@ -89,27 +145,173 @@ class DataStore:
             resulting_balance: Resulting balance after transaction (optional)
             txn_id: Transaction ID (optional)
             cheque_id: Cheque ID (optional)
-            metadata: Additional metadata (optional)
+            metadata: Additional metadata as a "k=v;k=v" string or a dict,
+                which is serialized when the row is written (optional)
         """
+        row = [
+            BankClock.to_iso_datetime(timestamp),  # one format for every row
+            username,
+            account_number,
+            action,
+            str(amount) if amount is not None else "",
+            mode if mode else "",
+            str(resulting_balance) if resulting_balance is not None else "",
+            txn_id if txn_id else "",
+            cheque_id if cheque_id else "",
+            metadata,
+        ]
+
         with DataStore._lock:
-            DataStore._ensure_activity_header()
+            if DataStore._activity_buffer is not None:
+                DataStore._activity_buffer.append(row)
+            else:
+                DataStore._write_activity_rows([row])
 
-            with open(DataStore.ACTIVITY_PATH, "a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(
-                    [
-                        timestamp,
-                        username,
-                        account_number,
-                        action,
-                        str(amount) if amount is not None else "",
-                        mode if mode else "",
-                        str(resulting_balance) if resulting_balance is not None else "",
-                        txn_id if txn_id else "",
-                        cheque_id if cheque_id else "",
-                        metadata if metadata else "",
-                    ]
-                )
+    @staticmethod
+    def _write_activity_rows(rows: List[list]):
+        """Append rows to the activity log in a single write (caller holds _lock)"""
+        if not rows:
+            return
+
+        DataStore._ensure_activity_header()
+
+        for row in rows:
+            row[-1] = DataStore._format_metadata(row[-1])
+
+        with open(DataStore.ACTIVITY_PATH, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerows(rows)
+
+    @staticmethod
+    def _format_metadata(metadata) -> str:
+        """Serialize activity metadata to the "k=v;k=v" log format"""
+        if not metadata:
+            return ""
+        if isinstance(metadata, dict):
+            return ";".join(f"{key}={value}" for key, value in metadata.items())
+        return metadata
+
+    @staticmethod
+    @contextmanager
+    def batch():
+        """
+        Buffer activity records and write them together when the block exits
+
+        Batches may be nested; rows are flushed when the outermost one exits.
+
+        Example:
+            with DataStore.batch():
+                ...  # append_activity calls are collected here
+        """
+        with DataStore._lock:
+            if DataStore._batch_depth == 0:
+                DataStore._activity_buffer = []
+            DataStore._batch_depth += 1
+
+        try:
+            yield
+        finally:
+            with DataStore._lock:
+                DataStore._batch_depth -= 1
+                if DataStore._batch_depth == 0:
+                    rows = DataStore._activity_buffer
+                    DataStore._activity_buffer = None
+                    DataStore._write_activity_rows(rows)
+
+    @staticmethod
+    def append_transfer(
+        timestamp: str,
+        mode: str,
+        amount: float,
+        sender_username: str,
+        sender_account_number: str,
+        sender_balance: float,
+        sender_txn_id: str,
+        recipient_username: str,
+        recipient_account_number: str,
+        recipient_balance: float,
+        recipient_txn_id: str,
+        cheque_id: Optional[str] = None,
+        metadata: Optional[str] = None,
+    ):
+        """
+        Append both sides of a transfer as a single activity record
+
+        The row is written from the sender's side with action
+        "<mode>_TRANSFER"; replay expands it back into the <mode>_SENT and
+        <mode>_RECEIVED transactions.
+
+        Args:
+            timestamp: Timestamp of the transfer
+            mode: Transfer mode (NEFT, RTGS, INTER_ACCOUNT)
+            amount: Transfer amount
+            sender_username: Sender's username
+            sender_account_number: Sender's account number
+            sender_balance: Sender's balance after the transfer
+            sender_txn_id: Sender's transaction ID
+            recipient_username: Recipient's username
+            recipient_account_number: Recipient's account number
+            recipient_balance: Recipient's balance after the transfer
+            recipient_txn_id: Recipient's transaction ID
+            cheque_id: Cheque ID (optional)
+            metadata: Sender-side metadata (optional)
+        """
+        paired_metadata = (
+            f"recipientUsername={recipient_username};"
+            f"recipientAccount={recipient_account_number};"
+            f"recipientBalance={recipient_balance};"
+            f"recipientTxnId={recipient_txn_id}"
+        )
+        if metadata:
+            paired_metadata += ";" + metadata
+
+        DataStore.append_activity(
+            timestamp=timestamp,
+            username=sender_username,
+            account_number=sender_account_number,
+            action=f"{mode}{DataStore._TRANSFER_SUFFIX}",
+            amount=amount,
+            mode=mode,
+            resulting_balance=sender_balance,
+            txn_id=sender_txn_id,
+            cheque_id=cheque_id,
+            metadata=paired_metadata,
+        )
+
+    @staticmethod
+    def _expand_activity_row(row: dict) -> List[dict]:
+        """
+        Expand a paired transfer row into its sent and received events
+
+        Args:
+            row: Activity log row as read by csv.DictReader
+
+        Returns:
+            List with the row itself, or the two logical transfer rows
+        """
+        action = row.get("action", "")
+        if not action.endswith(DataStore._TRANSFER_SUFFIX):
+            return [row]
+
+        mode = action[: -len(DataStore._TRANSFER_SUFFIX)]
+        meta = parse_metadata(row.get("metadata", ""))
+        recipient = {key: meta.pop(key, "") for key in DataStore._RECIPIENT_KEYS}
+
+        sent = dict(
+            row,
+            action=f"{mode}_SENT",
+            metadata=";".join(f"{key}={value}" for key, value in meta.items()),
+        )
+        received = dict(
+            row,
+            username=recipient["recipientUsername"],
+            accountNumber=recipient["recipientAccount"],
+            action=f"{mode}_RECEIVED",
+            resultingBalance=recipient["recipientBalance"],
+            txnId=recipient["recipientTxnId"],
+            metadata="",
+        )
+        return [sent, received]
 
     @staticmethod
     def load_accounts() -> List:
@@ -168,6 +370,10 @@ class DataStore:
             # Replay activity log
             DataStore._load_and_replay_activity(accounts)
 
+            # Persist restored account numbers once for the whole batch
+            if accounts:
+                Account._save_used_numbers()
+
             return accounts
 
     @staticmethod
@@ -186,12 +392,19 @@ class DataStore:
         # Create lookup maps
         by_username = {acc.username: acc for acc in accounts}
         by_account_number = {acc.account_number: acc for acc in accounts}
+        # Transaction ids per account, filled the first time an account is hit
+        known_ids = {}
+        replay_actions = DataStore._REPLAY_ACTIONS
 
         try:
             with open(DataStore.ACTIVITY_PATH, "r", encoding="utf-8") as f:
                 reader = csv.DictReader(f)
 
-                for row in reader:
+                for row in (
+                    event
+                    for physical_row in reader
+                    for event in DataStore._expand_activity_row(physical_row)
+                ):
                     try:
                         timestamp = row.get("timestamp", "")
                         username = row.get("username", "")
@@ -209,28 +422,16 @@ class DataStore:
                         if not account:
                             continue
 
-                        transaction_actions = [
-                            "DEPOSIT",
-                            "WITHDRAW",
-                            "NEFT_SENT",
-                            "NEFT_RECEIVED",
-                            "RTGS_SENT",
-                            "RTGS_RECEIVED",
-                            "INTER_ACCOUNT_SENT",
-                            "INTER_ACCOUNT_RECEIVED",
-                            "AMB_FEE",
-                            "AMB_FEE_SETTLED",
-                            "BILL_PAYMENT",
-                            "EXPENSE",
-                            "SALARY_CREDIT",
-                        ]
-                        if action in transaction_actions and amount_str and res_bal_str:
+                        if action in replay_actions and amount_str and res_bal_str:
                             try:
                                 amount = float(amount_str)
                                 res_balance = float(res_bal_str)
-                                if txn_id and not any(
-                                    t.id == txn_id for t in account.transactions
-                                ):
+                                ids = known_ids.get(account)
+                                if ids is None:
+                                    ids = known_ids[account] = {
+                                        t.id for t in account.transactions
+                                    }
+                                if txn_id and txn_id not in ids:
                                     txn = Transaction(
                                         id=txn_id,
                                         type=action,
@@ -241,6 +442,7 @@ class DataStore:
                                         metadata=metadata,  # Store metadata in Transaction
                                     )
                                     account.transactions.append(txn)
+                                    ids.add(txn_id)
                                     account.balance = res_balance
                             except ValueError:
                                 pass
@@ -265,7 +467,7 @@ class DataStore:
                 DataStore._ensure_dir(temp_json)
                 with open(temp_json, "w", encoding="utf-8") as f:
                     account_dicts = [acc.to_dict() for acc in accounts]
-                    json.dump(account_dicts, f, indent=2)
+                    DataStore._dump_json(account_dicts, f)
 
                 DataStore._atomic_replace(temp_json, DataStore.JSON_PATH, "JSON")
             except Exception as e:
@@ -353,7 +555,7 @@ class DataStore:
                 DataStore._ensure_dir(temp_json)
                 with open(temp_json, "w", encoding="utf-8") as f:
                     customer_dicts = [cust.to_dict() for cust in customers]
-                    json.dump(customer_dicts, f, indent=2)
+                    DataStore._dump_json(customer_dicts, f)
 
                 DataStore._atomic_replace(
                     temp_json, DataStore.CUSTOMER_JSON_PATH, "CUSTOMER_JSON"
@@ -395,7 +597,7 @@ class DataStore:
         """
         DataStore._ensure_dir(DataStore.LOANS_JSON_PATH)
         with open(DataStore.LOANS_JSON_PATH, "w", encoding="utf-8") as f:
-            json.dump([loan.to_dict() for loan in loans], f, indent=2)
+            DataStore._dump_json([loan.to_dict() for loan in loans], f)
 
     @staticmethod
     def load_loans() -> List:
@@ -415,9 +617,7 @@ class DataStore:
     @staticmethod
     def save_international_accounts(registry, verbose=False):
         """Save international accounts registry to JSON file"""
-        # Construct path relative to DataStore location (backend/data/)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        file_path = os.path.join(current_dir, "data", "international_accounts.json")
+        file_path = DataStore.INTERNATIONAL_JSON_PATH
         try:
             DataStore._ensure_dir(file_path)
             data = registry.to_dict()
@@ -435,9 +635,7 @@ class DataStore:
         """Load international accounts registry from JSON file"""
         from InternationalBankRegistry import InternationalBankRegistry
 
-        # Construct path relative to DataStore location (backend/data/)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        file_path = os.path.join(current_dir, "data", "international_accounts.json")
+        file_path = DataStore.INTERNATIONAL_JSON_PATH
 
         # If file doesn't exist, create new registry
         if not os.path.exists(file_path):
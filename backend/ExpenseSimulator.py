@@ -161,14 +161,12 @@ class ExpenseSimulator:
         Returns:
             List of (ExpenseTemplate, amount) tuples for expenses that occur today
         """
+        rand = random.random
         expenses = []
         for template in ExpenseSimulator.EXPENSE_TEMPLATES:
-            if random.random() < template.daily_probability:
-                amount = round(
-                    template.min_amount
-                    + random.random() * (template.max_amount - template.min_amount),
-                    2,
-                )
+            if rand() < template.daily_probability:
+                low = template.min_amount
+                amount = round(low + rand() * (template.max_amount - low), 2)
                 expenses.append((template, amount))
         return expenses
 
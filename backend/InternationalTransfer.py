@@ -162,8 +162,7 @@ class InternationalTransfer:
             t
             for t in account.transactions
             if t.type == "SWIFT_SENT"
-            and datetime.strptime(t.timestamp, "%d-%m-%Y %H:%M:%S").date()
-            == BankClock.today()
+            and t.get_date() == BankClock.today()
         ]
         today_total = sum(abs(t.amount) for t in today_international_txns)
 
@@ -176,7 +175,7 @@ class InternationalTransfer:
             )
 
         # Check account balance
-        min_balance = account._min_operational_balance
+        min_balance = account._MIN_OPERATIONAL_BALANCE
         if account.balance - total_debit_inr < min_balance:
             return (
                 False,
@@ -281,9 +280,7 @@ Transaction ID: {txn.id}
                         isinstance(txn.metadata, dict)
                         and txn.metadata.get("swift_reference") == swift_reference
                     ):
-                        txn_date = datetime.strptime(
-                            txn.timestamp, "%d-%m-%Y %H:%M:%S"
-                        ).date()
+                        txn_date = txn.get_date()
                         days_elapsed = (BankClock.today() - txn_date).days
                         expected_arrival = datetime.strptime(
                             txn.metadata["expected_arrival"], "%Y-%m-%d"
@@ -327,13 +324,7 @@ Transaction ID: {txn.id}
 
         for txn in account.transactions:
             if txn.type == "SWIFT_SENT":
-                try:
-                    txn_date = datetime.strptime(
-                        txn.timestamp, "%d-%m-%Y %H:%M:%S"
-                    ).date()
-                    if txn_date == today:
-                        total += abs(txn.amount)
-                except:
-                    pass
+                if txn.get_date() == today:
+                    total += abs(txn.amount)
 
         return total
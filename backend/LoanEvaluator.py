@@ -5,6 +5,9 @@ from datetime import date
 class LoanEvaluator:
     """Evaluates loan applications based on customer profile and CIBIL score"""
 
+    ELIGIBLE_EMPLOYER_CATEGORIES = frozenset({"A", "B"})
+    ELIGIBLE_CITIES = ("Bengaluru", "Mumbai", "Delhi")
+
     @staticmethod
     def evaluate(
         customer, principal: float, tenure_months: int, interest_rate: float, bank
@@ -30,7 +33,7 @@ class LoanEvaluator:
             return False, "Missing job starting date"
 
         try:
-            job_days = (date.today() - date.fromisoformat(job_start_date)).days
+            job_days = (date.today() - customer.job_start).days
         except Exception:
             return False, "Invalid job start date"
 
@@ -38,7 +41,14 @@ class LoanEvaluator:
             return False, "Less than 1 year in current employment"
 
         # 4. DTI (Debt-to-Income) Check
-        if customer.get_DTI(bank) > 0.5:
+        # EMIs of the active loans, reused by the total obligations check below
+        # (same figure as customer.get_DTI, salary is known to be positive here)
+        total_emi = sum(
+            loan.calculate_emi()
+            for loan in bank.iter_loans_for_customer(customer.customer_id)
+            if loan.status == "Active"
+        )
+        if total_emi / salary > 0.5:
             return False, "High debt-to-income ratio (exceeds 50%)"
 
         # 5. Age Check - must be 18-60
@@ -56,14 +66,14 @@ class LoanEvaluator:
 
         # 7. Employer Category Check (A or B only, not C)
         employer_category = getattr(customer, "employer_category", None)
-        if employer_category is None or employer_category not in {"A", "B"}:
+        if employer_category not in LoanEvaluator.ELIGIBLE_EMPLOYER_CATEGORIES:
             return (
                 False,
                 "Employer category not supported (Only A or B category employers)",
             )
 
         # 8. City / Location Check
-        allowed_cities = {"Bengaluru", "Mumbai", "Delhi"}
+        allowed_cities = LoanEvaluator.ELIGIBLE_CITIES
         customer_city = getattr(customer, "city", None)
         if customer_city and customer_city not in allowed_cities:
             return (
@@ -79,12 +89,8 @@ class LoanEvaluator:
 
         # 10. EMI Affordability Check
         monthly_rate = (interest_rate / 100) / 12
-        emi = (
-            principal
-            * monthly_rate
-            * ((1 + monthly_rate) ** tenure_months)
-            / (((1 + monthly_rate) ** tenure_months) - 1)
-        )
+        growth = (1 + monthly_rate) ** tenure_months
+        emi = principal * monthly_rate * growth / (growth - 1)
 
         # EMI should not exceed 50% of monthly income
         if emi > salary * 0.5:
@@ -94,11 +100,6 @@ class LoanEvaluator:
             )
 
         # 11. Total Debt Obligations Check
-        existing_loans = bank.get_loans_for_customer(customer.customer_id)
-        total_emi = sum(
-            loan.calculate_emi() for loan in existing_loans if loan.status == "Active"
-        )
-
         total_obligations = total_emi + emi
         dti_ratio = total_obligations / salary
 
@@ -1,9 +1,16 @@
+import sys
 from dataclasses import dataclass, field
+from datetime import date
 from typing import Optional
 from BankClock import BankClock
 from TransactionRegistry import TransactionRegistry
 
-@dataclass
+# Accounts hold many transactions; drop the per-instance __dict__ where the
+# dataclass decorator supports it (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Transaction:
     """Represents a financial transaction in the banking system"""
     
@@ -11,12 +18,20 @@ class Transaction:
     amount: float
     resulting_balance: float
     id: str = field(default_factory=TransactionRegistry.generate_id)
-    timestamp: str = field(default_factory=BankClock.get_formatted_datetime)
+    timestamp: str = field(default_factory=BankClock.get_iso_datetime)
     cheque_id: Optional[str] = None
     category: Optional[str] = None
     merchant: Optional[str] = None
     payment_method: Optional[str] = None
     metadata: Optional[str] = None  # Added for arbitrary data (e.g. loan EMI info)
+    _date: Optional[date] = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Migrate legacy dd-mm-yyyy timestamps to ISO-8601 on creation/load"""
+        self.timestamp = BankClock.to_iso_datetime(self.timestamp)
 
     def to_dict(self) -> dict:
         """
@@ -38,6 +53,20 @@ class Transaction:
             "metadata": self.metadata  # Include metadata in serialization
         }
 
+    def _to_dict_cached(self) -> dict:
+        """
+        Get the serialized form, built once per transaction
+        
+        Recorded transactions are never modified, so the dictionary is
+        reused across saves. Callers must treat it as read-only.
+        
+        Returns:
+            Dictionary representation of the transaction
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self.to_dict()
+        return self._dict_cache
+
     @staticmethod
     def from_dict(data: dict) -> 'Transaction':
         """
@@ -54,7 +83,7 @@ class Transaction:
             type=data["type"],
             amount=data["amount"],
             resulting_balance=data["resultingBalance"],
-            timestamp=data.get("timestamp", BankClock.get_formatted_datetime()),
+            timestamp=data.get("timestamp", BankClock.get_iso_datetime()),
             cheque_id=data.get("chequeId"),
             category=data.get("category"),
             merchant=data.get("merchant"),
@@ -62,6 +91,20 @@ class Transaction:
             metadata=data.get("metadata")       # Load metadata if present
         )
     
+    def get_date(self) -> Optional[date]:
+        """
+        Get the calendar date of the transaction (parsed once, then cached)
+        
+        Returns:
+            Transaction date, or None if the timestamp cannot be parsed
+        """
+        if self._date is None:
+            try:
+                self._date = date.fromisoformat(self.timestamp[:10])
+            except ValueError:
+                return None
+        return self._date
+    
     def get_formatted_amount(self) -> str:
         """
         Get formatted amount string with currency symbol
@@ -87,12 +130,7 @@ class Transaction:
         Returns:
             True if transaction is a debit type
         """
-        debit_types = [
-            "WITHDRAW", "NEFT_SENT", "RTGS_SENT", "INTER_ACCOUNT_SENT",
-            "AMB_FEE", "AMB_FEE_SETTLED", "EXPENSE", "BILL_PAYMENT",
-            "TAX_DEDUCTED"
-        ]
-        return self.type in debit_types
+        return self.type in TransactionType.DEBIT_TYPES
     
     def is_credit(self) -> bool:
         """
@@ -101,11 +139,7 @@ class Transaction:
         Returns:
             True if transaction is a credit type
         """
-        credit_types = [
-            "DEPOSIT", "NEFT_RECEIVED", "RTGS_RECEIVED", 
-            "INTER_ACCOUNT_RECEIVED", "SALARY"
-        ]
-        return self.type in credit_types
+        return self.type in TransactionType.CREDIT_TYPES
     
     def get_transaction_type_display(self) -> str:
         """
@@ -114,23 +148,10 @@ class Transaction:
         Returns:
             Formatted transaction type string
         """
-        type_mappings = {
-            "DEPOSIT": "Deposit",
-            "WITHDRAW": "Withdrawal",
-            "NEFT_SENT": "NEFT Transfer (Sent)",
-            "NEFT_RECEIVED": "NEFT Transfer (Received)",
-            "RTGS_SENT": "RTGS Transfer (Sent)",
-            "RTGS_RECEIVED": "RTGS Transfer (Received)",
-            "INTER_ACCOUNT_SENT": "Inter-Account Transfer (Sent)",
-            "INTER_ACCOUNT_RECEIVED": "Inter-Account Transfer (Received)",
-            "AMB_FEE": "Average Monthly Balance Fee",
-            "AMB_FEE_SETTLED": "AMB Fee Settlement",
-            "EXPENSE": "Expense",
-            "BILL_PAYMENT": "Bill Payment",
-            "SALARY": "Salary Credit",
-            "TAX_DEDUCTED": "Tax Deduction (TDS)"
-        }
-        return type_mappings.get(self.type, self.type.replace("_", " ").title())
+        display = TransactionType.DISPLAY_NAMES.get(self.type)
+        if display is None:
+            display = self.type.replace("_", " ").title()
+        return display
     
     def get_display_line(self, show_category: bool = True) -> str:
         """
@@ -204,6 +225,33 @@ class TransactionType:
     AMB_FEE_SETTLED = "AMB_FEE_SETTLED"
     TAX_DEDUCTED = "TAX_DEDUCTED"
     
+    # Lookup tables built once for per-transaction classification
+    CREDIT_TYPES = frozenset(
+        (DEPOSIT, NEFT_RECEIVED, RTGS_RECEIVED, INTER_ACCOUNT_RECEIVED, SALARY)
+    )
+    DEBIT_TYPES = frozenset(
+        (
+            WITHDRAW, NEFT_SENT, RTGS_SENT, INTER_ACCOUNT_SENT, EXPENSE,
+            BILL_PAYMENT, AMB_FEE, AMB_FEE_SETTLED, TAX_DEDUCTED
+        )
+    )
+    DISPLAY_NAMES = {
+        DEPOSIT: "Deposit",
+        WITHDRAW: "Withdrawal",
+        NEFT_SENT: "NEFT Transfer (Sent)",
+        NEFT_RECEIVED: "NEFT Transfer (Received)",
+        RTGS_SENT: "RTGS Transfer (Sent)",
+        RTGS_RECEIVED: "RTGS Transfer (Received)",
+        INTER_ACCOUNT_SENT: "Inter-Account Transfer (Sent)",
+        INTER_ACCOUNT_RECEIVED: "Inter-Account Transfer (Received)",
+        AMB_FEE: "Average Monthly Balance Fee",
+        AMB_FEE_SETTLED: "AMB Fee Settlement",
+        EXPENSE: "Expense",
+        BILL_PAYMENT: "Bill Payment",
+        SALARY: "Salary Credit",
+        TAX_DEDUCTED: "Tax Deduction (TDS)"
+    }
+    
     @staticmethod
     def get_all_credit_types() -> list:
         """Get list of all credit transaction types"""
@@ -2,6 +2,20 @@ from datetime import date
 
 
 class Loan:
+    __slots__ = (
+        "loan_id",
+        "customer_id",
+        "principal",
+        "interest_rate",
+        "tenure_months",
+        "status",
+        "emis_paid",
+        "approval_reason",
+        "start_date",
+        "closure_date",
+        "_emi_cache",
+    )
+
     def __init__(
         self,
         loan_id: str,
@@ -25,16 +39,24 @@ class Loan:
         self.approval_reason = approval_reason
         self.start_date = start_date
         self.closure_date = closure_date
+        self._emi_cache = None  # ((principal, rate, tenure), emi)
 
     def calculate_emi(self) -> float:
         """Calculate monthly EMI using reducing balance method"""
-        P = self.principal  # Changed
-        r = self.interest_rate / (12 * 100)  # Changed
-        n = self.tenure_months
+        # Reuse the last result while the loan terms are unchanged
+        terms = (self.principal, self.interest_rate, self.tenure_months)
+        cached = self._emi_cache
+        if cached is not None and cached[0] == terms:
+            return cached[1]
+
+        P, rate, n = terms
+        r = rate / (12 * 100)
         if r == 0:
-            return P / n
-        emi = (P * r * (1 + r) ** n) / ((1 + r) ** n - 1)
-        return round(emi, 2)
+            emi = P / n
+        else:
+            emi = round((P * r * (1 + r) ** n) / ((1 + r) ** n - 1), 2)
+        self._emi_cache = (terms, emi)
+        return emi
 
     def to_dict(self):
         return {